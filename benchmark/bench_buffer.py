@@ -0,0 +1,97 @@
+"""
+Framing of large fragmented packets through PacketParser.parsing
+
+Large packet (Teltonika black-box backlog or long WialonIPSv2 #B#) is
+delivered in small reads, every read is followed by parsing attempt like
+in client loop. Time per KiB must stay flat when packet grows.
+
+    python -m benchmark.bench_buffer --chunk 1024
+"""
+import argparse
+import time
+
+from benchmark.common import (
+    print_table,
+    teltonika_packet,
+    teltonika_record,
+    wialon_packet,
+)
+from src.protocol import Teltonika, WialonIPSv2
+from src.protocol.parser import PacketParser
+from src.utils.buffer import Buffer
+from src.utils.config import ServerConfig
+from src.utils.unit import Unit
+
+WIALON_SD = b'010125;112233;5128.199596;N;00000.122544;E;10;20;30;7'
+
+
+class FramingTeltonika(Teltonika):
+    def parsing_packet(self, bytes_data, unit):
+        return None
+
+
+class FramingWialonIPSv2(WialonIPSv2):
+    def parsing_packet(self, bytes_, unit):
+        return None
+
+
+def teltonika(size: int) -> bytes:
+    record = teltonika_record(io_count=28)
+    return teltonika_packet([record] * min(size // len(record), 255))
+
+
+def wialon(size: int) -> bytes:
+    count = size // (len(WIALON_SD) + 1)
+    return wialon_packet(b'B', b'|'.join([WIALON_SD] * count) + b';')
+
+
+PROTOCOLS = {
+    'teltonika': (FramingTeltonika, teltonika),
+    'wialon': (FramingWialonIPSv2, wialon),
+}
+
+
+def feed(protocol_class, packet: bytes, chunk: int, repeat: int) -> float:
+    protocol = protocol_class()
+    config = ServerConfig(host='127.0.0.1', port=1)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        unit = Unit()
+        unit.id = 1
+        parser = PacketParser(protocol)
+        buffer = Buffer(handler=protocol, config=config)
+
+        frames = 0
+        for offset in range(0, len(packet), chunk):
+            buffer.update(packet[offset:offset + chunk])
+            while buffer.is_not_empty:
+                if parser.parsing(buffer=buffer, unit=unit):
+                    frames += 1
+        assert frames == 1, frames
+
+    return (time.perf_counter() - start) / repeat
+
+
+def main(chunk: int, repeat: int):
+    for name, (protocol_class, build) in PROTOCOLS.items():
+        rows = [('packet, KiB', 'parse, ms', 'us per KiB')]
+        for size in (8, 16, 32, 64):
+            packet = build(size * 1024)
+            spent = feed(protocol_class, packet, chunk, repeat)
+            kib = len(packet) / 1024
+            rows.append((
+                round(kib, 1),
+                round(spent * 1000, 3),
+                round(spent * 1_000_000 / kib, 2),
+            ))
+        print_table(f'{name}, reads of {chunk} bytes', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--chunk', type=int, default=1024)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    main(args.chunk, args.repeat)
@@ -0,0 +1,75 @@
+"""
+Burst replay: device reconnects and flushes queued packets with one write
+
+Every round one device sends --frames WialonIPSv2 #D# packets in one write
+and waits all answers, consumer drains server.messages.
+
+    python -m benchmark.bench_burst --frames 500 --batch-size 1 256
+"""
+import argparse
+import asyncio
+import time
+
+from benchmark.common import (
+    AcceptAllAuthorization,
+    DATA,
+    open_client,
+    print_table,
+)
+from src.protocol import WialonIPSv2
+from src.server.tcp import TCPServer
+from src.utils.config import ServerConfig
+
+HOST = '127.0.0.1'
+PORT = 50_102
+ANSWER = b'#AD#1\r\n'
+
+
+async def consume(server: TCPServer):
+    while True:
+        await server.messages.get()
+
+
+async def run(batch_size: int, frames: int, rounds: int) -> float:
+    server = TCPServer(
+        config=ServerConfig(host=HOST, port=PORT, batch_size=batch_size),
+        protocol=WialonIPSv2(),
+        authorization=AcceptAllAuthorization(),
+    )
+    await server.run()
+    consumer = asyncio.create_task(consume(server))
+
+    reader, writer = await open_client(HOST, PORT)
+    burst = DATA * frames
+    expected = len(ANSWER) * frames
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        writer.write(burst)
+        await writer.drain()
+        await reader.readexactly(expected)
+    spent = time.perf_counter() - start
+
+    consumer.cancel()
+    writer.close()
+    await server.stop()
+    return frames * rounds / spent
+
+
+async def main(batch_sizes: list[int], frames: int, rounds: int):
+    rows = [('batch size', 'packets/s')]
+    for batch_size in batch_sizes:
+        rows.append((batch_size, round(await run(batch_size, frames, rounds))))
+    print_table(f'Burst replay, {frames} packets per write', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=40)
+    parser.add_argument(
+        '--batch-size', type=int, nargs='+', default=[1, 16, 256]
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.batch_size, args.frames, args.rounds))
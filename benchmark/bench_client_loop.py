@@ -0,0 +1,105 @@
+"""
+Idle CPU and packet-to-ack latency of client connection loop
+
+Opens many idle logged-in connections, measures CPU time consumed by the
+server process while they stay idle, then measures ack latency of data
+packets sent by one more device. Memory per connection includes client side
+sockets of benchmark itself, compare servers with each other.
+
+    python -m benchmark.bench_client_loop --connections 2000
+    python -m benchmark.bench_client_loop --server buffered
+"""
+import argparse
+import asyncio
+import time
+
+from benchmark.common import (
+    AcceptAllAuthorization,
+    DATA,
+    open_client,
+    percentile,
+    print_table,
+    rss_bytes,
+    wialon_login,
+)
+from src.protocol import WialonIPSv2
+from src.server.tcp import TCPServer, TCPBufferedServer
+from src.utils.config import ServerConfig
+
+HOST = '127.0.0.1'
+PORT = 50_101
+SERVERS = {
+    'tcp': TCPServer,
+    'buffered': TCPBufferedServer,
+}
+
+
+async def consume(server: TCPServer):
+    while True:
+        await server.messages.get()
+
+
+async def main(
+        connections: int,
+        idle_seconds: float,
+        packets: int,
+        server_name: str = 'tcp',
+):
+    server = SERVERS[server_name](
+        config=ServerConfig(host=HOST, port=PORT),
+        protocol=WialonIPSv2(),
+        authorization=AcceptAllAuthorization(),
+    )
+    await server.run()
+    consumer = asyncio.create_task(consume(server))
+
+    rss_start = rss_bytes()
+    clients = []
+    for imei in range(connections):
+        clients.append(
+            await open_client(HOST, PORT, wialon_login(100_000 + imei))
+        )
+    await asyncio.sleep(0.5)
+    rss_per_connection = (rss_bytes() - rss_start) / connections
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.sleep(idle_seconds)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    reader, writer = await open_client(HOST, PORT, wialon_login(99_999))
+    latencies = []
+    for _ in range(packets):
+        start = time.perf_counter()
+        writer.write(DATA)
+        await writer.drain()
+        await reader.read(64)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    print_table(
+        f'Client loop, {server_name} server, {connections} idle connections',
+        [
+            ('rss per connection, KiB', round(rss_per_connection / 1024, 1)),
+            ('idle cpu, %', round(cpu / wall * 100, 2)),
+            ('ack latency p50, us', round(percentile(latencies, 50), 1)),
+            ('ack latency p99, us', round(percentile(latencies, 99), 1)),
+        ]
+    )
+
+    consumer.cancel()
+    for _, client_writer in clients + [(reader, writer)]:
+        client_writer.close()
+    await server.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--connections', type=int, default=2000)
+    parser.add_argument('--idle-seconds', type=float, default=5)
+    parser.add_argument('--packets', type=int, default=1000)
+    parser.add_argument('--server', choices=SERVERS, default='tcp')
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(args.connections, args.idle_seconds, args.packets, args.server)
+    )
@@ -0,0 +1,79 @@
+"""
+Teltonika AVL decoding throughput (Teltonika.parsing_packet)
+
+Packets with 255 records (full black-box flush), codec 8 and 8E.
+Codec 8 is also decoded by NumPy (if installed): into Message objects
+and into columnar TeltonikaBatch.
+
+    python -m benchmark.bench_teltonika --io-count 4 28
+"""
+import argparse
+import time
+
+from benchmark.common import print_table, teltonika_packet, teltonika_record
+from src.protocol import Teltonika
+from src.protocol.teltonika.vectorized import np
+from src.utils.unit import Unit
+
+
+def messages(protocol: Teltonika, bytes_data: bytes, unit: Unit) -> list:
+    # records are decoded by generator
+    return list(protocol.parsing_packet(bytes_data, unit))
+
+
+DECODERS = {
+    'python': (False, messages),
+    'numpy': (True, messages),
+    'numpy batch': (True, Teltonika.parsing_packet_batch),
+}
+
+
+def decode(packet: bytes, decoder: str, repeat: int) -> tuple[float, str]:
+    vectorized, parsing = DECODERS[decoder]
+    protocol = Teltonika(vectorized=vectorized)
+    unit = Unit()
+    # parsing_packet gets packet without preamble
+    bytes_data = packet[4:]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        messages = parsing(protocol, bytes_data, unit)
+    spent = time.perf_counter() - start
+
+    assert len(messages) == 255
+    info = protocol.io_plan_cache_info()
+    if not info.hits + info.misses:
+        return 255 * repeat / spent, '-'
+    return 255 * repeat / spent, f'{info.hits / (info.hits + info.misses):.2%}'
+
+
+def main(io_counts: list[int], repeat: int):
+    rows = [
+        ('codec', 'io per record', 'decoder', 'records/s', 'plan cache hits')
+    ]
+    for extended in (False, True):
+        for io_count in io_counts:
+            record = teltonika_record(io_count=io_count, extended=extended)
+            packet = teltonika_packet([record] * 255, extended=extended)
+            for decoder in DECODERS:
+                if decoder != 'python' and (extended or np is None):
+                    continue
+
+                records, hit_rate = decode(packet, decoder, repeat)
+                rows.append((
+                    '8E' if extended else '8',
+                    io_count,
+                    decoder,
+                    round(records),
+                    hit_rate,
+                ))
+    print_table('Teltonika decoding, 255 records per packet', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--io-count', type=int, nargs='+', default=[4, 28])
+    parser.add_argument('--repeat', type=int, default=40)
+    args = parser.parse_args()
+
+    main(args.io_count, args.repeat)
@@ -0,0 +1,54 @@
+"""
+WialonIPSv2 data packets decoding throughput
+
+crc check and parsing of one packet, like PacketParser does for every frame:
+#D# with inputs, outputs, adc and params, #B# with 20 short messages.
+
+    python -m benchmark.bench_wialon --repeat 20000
+"""
+import argparse
+import time
+
+from benchmark.common import print_table, wialon_packet
+from src.protocol import WialonIPSv2
+from src.utils.unit import Unit
+
+MESSAGE_D = (
+    b'010125;112233;5128.199596;N;03708.122544;W;35;270;140;11;0.9;'
+    b'5;2;12.5,0.7;NA;'
+    b'fuel:2:45.5,odometer:1:123456,driver:3:Ivan,ignition:1:1'
+)
+MESSAGE_SD = b'010125;112233;5128.199596;N;03708.122544;W;35;270;140;11'
+
+PACKETS = {
+    '#D#': (wialon_packet(b'D', MESSAGE_D + b';'), 1),
+    '#B#': (wialon_packet(b'B', b'|'.join([MESSAGE_SD] * 20) + b';'), 20),
+}
+
+
+def decode(packet: bytes, repeat: int) -> float:
+    protocol = WialonIPSv2()
+    unit = Unit()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        assert protocol.check_crc_data(packet, unit)
+        # #B# messages are decoded by generator
+        list(protocol.parsing_packet(packet, unit))
+    return repeat / (time.perf_counter() - start)
+
+
+def main(repeat: int):
+    rows = [('packet', 'messages', 'packets/s', 'messages/s')]
+    for name, (packet, messages) in PACKETS.items():
+        packets = decode(packet, repeat)
+        rows.append((name, messages, round(packets), round(packets * messages)))
+    print_table('WialonIPSv2 decoding', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20_000)
+    args = parser.parse_args()
+
+    main(args.repeat)
@@ -0,0 +1,127 @@
+import asyncio
+import os
+import statistics
+import struct
+from typing import Optional
+
+from fastcrc import crc16
+
+from src.auth.abstract import AbstractAuthorization
+
+
+LOGIN = b'#L#2.0;860000000000000;NA;46D4\r\n'
+DATA = (
+    b'#D#010125;112233;5128.199596;N;00000.122544;E;0;0;0;0;0;0;NA;;NA;'
+    b'example1:1:0,example2:2:0.12,example3:1:123;72D3\r\n'
+)
+
+
+def wialon_packet(packet_type: bytes, body: bytes) -> bytes:
+    """
+    Build WialonIPSv2 packet with correct crc, body must end with b';'
+    """
+    return b'#%b#%b%X\r\n' % (packet_type, body, crc16.arc(body))
+
+
+def wialon_login(imei: int) -> bytes:
+    return wialon_packet(b'L', b'2.0;%d;NA;' % imei)
+
+
+def teltonika_login(imei: int) -> bytes:
+    imei_ = b'%d' % imei
+    return struct.pack('>H', len(imei_)) + imei_
+
+
+def teltonika_record(
+        timestamp: int = 1_560_161_086_000,
+        io_count: int = 4,
+        extended: bool = False,
+) -> bytes:
+    """
+    One AVL record for codec 8 (or 8E if extended) with io_count 8-byte IO
+    """
+    record = struct.pack(
+        '>QB2I2HBH',
+        timestamp, 1,
+        254_000_000, 540_000_000, 120, 90, 9, 60,
+    )
+    if extended:
+        record += struct.pack('>HH', 0, 4 + io_count)
+        record += struct.pack('>HHBHB', 2, 239, 1, 240, 0)
+        record += struct.pack('>HHH', 1, 24, 60)
+        record += struct.pack('>H', 0)
+        record += struct.pack('>H', io_count)
+        for io_id in range(io_count):
+            record += struct.pack('>HQ', 300 + io_id, io_id * 1000)
+        record += struct.pack('>HHH', 1, 385, 3) + b'\x01\x02\x03'
+    else:
+        record += struct.pack('>BB', 0, 2 + io_count)
+        record += struct.pack('>BBBBB', 2, 239, 1, 240, 0)
+        record += struct.pack('>B', 0)
+        record += struct.pack('>B', 0)
+        record += struct.pack('>B', io_count)
+        for io_id in range(io_count):
+            record += struct.pack('>BQ', 100 + io_id, io_id * 1000)
+    return record
+
+
+def teltonika_packet(records: list[bytes], extended: bool = False) -> bytes:
+    body = (
+        (b'\x8e' if extended else b'\x08')
+        + bytes([len(records)])
+        + b''.join(records)
+        + bytes([len(records)])
+    )
+    return (
+        b'\x00\x00\x00\x00'
+        + struct.pack('>L', len(body))
+        + body
+        + struct.pack('>L', crc16.arc(body))
+    )
+
+
+class AcceptAllAuthorization(AbstractAuthorization):
+    """
+    Every device is authorized, unit id is taken from imei
+    """
+
+    async def authorized_in_system(
+            self,
+            imei: str,
+            protocol: str,
+            password: Optional[str] = None
+    ):
+        return int(imei)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100)[int(pct) - 1]
+
+
+def rss_bytes() -> int:
+    """
+    Current resident set size of process (linux)
+    """
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def print_table(title: str, rows: list[tuple]):
+    print(f'\n{title}')
+    for row in rows:
+        print('  ' + ' | '.join(str(col) for col in row))
+
+
+async def open_client(host: str, port: int, login: bytes = LOGIN):
+    """
+    Open connection to server and make login, return (reader, writer)
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(login)
+    await writer.drain()
+    await reader.read(64)
+    return reader, writer
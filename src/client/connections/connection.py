@@ -1,6 +1,11 @@
 import asyncio
+import copy
 import logging
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
+from traceback import format_exc as tb
+from typing import Optional
 
 from src.auth.abstract import (
     AbstractAuthorization,
@@ -10,10 +15,12 @@ from src.auth.abstract import (
 from src.client.connector.abstract import T
 from src.protocol.parser import PacketParser
 from src.protocol.abstract import AbstractProtocol
-from src.protocol.interface import MessageAnnotated
+from src.status import StatusException
 from src.status.abstract import Status
 from src.utils.buffer import Buffer
+from src.utils.config import ServerConfig
 from src.utils.datamanager import DataManager, Packet, Command, Data
+from src.utils.message import Message
 from src.utils.unit import Unit
 
 
@@ -26,21 +33,26 @@ class ClientConnection:
             connector: T,   # ConnectorAbstract
             authorization: AbstractAuthorization,
             protocol: AbstractProtocol,
+            config: ServerConfig,
             *args,
             **kwargs
     ):
         self.data_manager: DataManager = data_manager
         self.server_status: asyncio.Event = server_status
-        self.authorization: AbstractAuthorization = authorization
+        # own copy, ClientConnections patch authorized_in_system per connection
+        self.authorization: AbstractAuthorization = copy.copy(authorization)
         self.connector: T = connector
         self.protocol: AbstractProtocol = protocol
         self.unit = Unit()
         self.parser = PacketParser(protocol)
         self.buffer = Buffer(
             handler=protocol,
+            config=config,
             *args,
             **kwargs
         )
+        self.batch_size: int = config.batch_size
+        self.publish_chunk_size: int = config.publish_chunk_size
 
     def __repr__(self):
         return (
@@ -63,6 +75,13 @@ class ClientConnection:
             4) if status incorrect make fail answer and break connection
         4) if status is correct make answer for unit
         5) repeat 1) -> 2) ....
+
+        All complete packets in buffer (not more than batch_size) are
+        processed per one wakeup, messages published by one batch
+        and answers sent by one write
+
+        Without new data loop waits connector.wait_new_data(),
+        connector wake up it on new data, close connection or timeout
         """
 
         await asyncio.sleep(0)
@@ -72,53 +91,129 @@ class ClientConnection:
 
                 self.buffer.update(self.connector.execute_bytes())
 
-                result = self.parser.parsing(
-                    buffer=self.buffer,
-                    unit=self.unit,
-                )
+                if not await self._process_buffer():
+                    break
+
+            else:
+                await self.connector.wait_new_data()
 
-                if not result:
-                    continue
+            if self.connector.is_not_alive:
+                break
 
-                status, messages, packet = result
+        self.unit.disconnected_at = datetime.now()
 
-                if status.correct and not self.unit.is_authorized:
-                    status = await self._authorization(
-                        status=status,
-                        unit=self.unit,
-                    )
+    async def _process_buffer(self) -> bool:
+        """
+        Process complete packets from buffer
+        Messages returned by iterator are published by chunks,
+        answer for packet is sent after all its messages
+        :return: bool False if connection must be closed
+        """
+        batch: list[Data] = list()
+        answers: list[bytes] = list()
 
-                answer = status.make_answer(
-                    handler=self.protocol,
+        while len(answers) < self.batch_size and self.buffer.is_not_empty:
+            result = self.parser.parsing(
+                buffer=self.buffer,
+                unit=self.unit,
+            )
+
+            if not result:
+                continue
+
+            status, messages, packet = result
+
+            if status.correct and not self.unit.is_authorized:
+                status = await self._authorization(
+                    status=status,
                     unit=self.unit,
                 )
 
-                if not status.correct:
-                    logging.info(f'Problems with package analysis {status}.')
-                    await self.connector.send(answer)
-                    break
+            answer = status.make_answer(
+                handler=self.protocol,
+                unit=self.unit,
+            )
+
+            if status.correct and isinstance(messages, Iterator):
+                # messages of previous packets go first
+                await self.data_manager.messages.put_batch(batch)
+                batch = list()
 
-                ip, port = self.connector.address
-                await self._publish(
+                error = await self._publish_iterator(
                     messages=messages,
-                    packet=Packet(
-                        packet=packet,
-                        client_port=port,
-                        client_ip=ip,
-                        time_received=datetime.now(),
-                    ),
                     answer=answer,
+                    packet=self._packet(packet),
                 )
+                if error is not None:
+                    status = error
+                    answer = status.make_answer(
+                        handler=self.protocol,
+                        unit=self.unit,
+                    )
+                messages = None
 
+            if not status.correct:
+                logging.info(f'Problems with package analysis {status}.')
+                await self._publish_batch(batch, answers)
                 await self.connector.send(answer)
+                return False
 
-            else:
-                await asyncio.sleep(0.05)
+            if messages:
+                batch.append(
+                    Data(
+                        unit=self.unit,
+                        messages=messages,
+                        answer=answer,
+                        packet=self._packet(packet),
+                    )
+                )
+            answers.append(answer)
 
-            if self.connector.is_not_alive:
-                break
+        await self._publish_batch(batch, answers)
+        return True
 
-        self.unit.disconnected_at = datetime.now()
+    def _packet(self, packet: bytes) -> Packet:
+        ip, port = self.connector.address
+        return Packet(
+            packet=packet,
+            client_port=port,
+            client_ip=ip,
+            time_received=datetime.now(),
+        )
+
+    async def _publish_iterator(
+            self,
+            messages: Iterator[Message],
+            answer: bytes,
+            packet: Packet,
+    ) -> Optional[StatusException]:
+        """
+        Publish messages of one packet by chunks while they are decoded,
+        answer for packet is sent by caller after all chunks
+        :return: status of exception raised by decoding, chunks published
+        before exception stay published
+        """
+        while True:
+            try:
+                chunk = list(islice(messages, self.publish_chunk_size))
+            except Exception as e:
+                logging.error(f"Parsing exception {e} in {self.unit}")
+                logging.debug(tb())
+                return StatusException.from_exception(e, 'parsing_packet')
+
+            if not chunk:
+                return None
+
+            await self.data_manager.messages.put_batch([
+                Data(
+                    unit=self.unit,
+                    messages=chunk,
+                    answer=answer,
+                    packet=packet,
+                )
+            ])
+            # consumer can take chunk before next one is decoded
+            await asyncio.sleep(0)
 
     async def close_connection(self):
         await self.connector.close_connection()
@@ -135,21 +230,19 @@ class ClientConnection:
             command_body=command,
         )
 
-    async def _publish(
+    async def _publish_batch(
             self,
-            messages: MessageAnnotated,
-            packet: Packet,
-            answer: bytes
+            batch: list[Data],
+            answers: list[bytes],
     ):
-        if messages:
-            await self.data_manager.messages.put(
-                Data(
-                    unit=self.unit,
-                    messages=messages,
-                    answer=answer,
-                    packet=packet,
-                )
-            )
+        """
+        Publish messages of processed packets, after send answers for them
+        """
+        if batch:
+            await self.data_manager.messages.put_batch(batch)
+
+        if answers:
+            await self.connector.send_many(answers)
 
     async def _authorization(
             self,
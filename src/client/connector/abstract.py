@@ -14,6 +14,9 @@ class ConnectorAbstract(ConnectorInterface):
     def new_data(self) -> bool:
         raise NotImplementedError
 
+    async def wait_new_data(self):
+        raise NotImplementedError
+
     def execute_bytes(self) -> bytes:
         raise NotImplementedError
 
@@ -31,5 +34,8 @@ class ConnectorAbstract(ConnectorInterface):
     async def send(self, data: bytes):
         raise NotImplementedError
 
+    async def send_many(self, data: list[bytes]):
+        raise NotImplementedError
+
 
 T = TypeVar('T', bound=ConnectorAbstract)
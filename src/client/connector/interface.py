@@ -23,6 +23,14 @@ class ConnectorInterface(object, metaclass=abc.ABCMeta):
         :return: bool (flag new data)
         """
 
+    @abstractmethod
+    async def wait_new_data(self):
+        """
+        Wait until new data arrives, connection is closed or timeout expired
+        Used by client loop instead of polling new_data
+        :return: None
+        """
+
     @abstractmethod
     def execute_bytes(self) -> bytes:
         """
@@ -60,3 +68,11 @@ class ConnectorInterface(object, metaclass=abc.ABCMeta):
         :param data: bytes
         :return: None
         """
+
+    @abstractmethod
+    async def send_many(self, data: list[bytes]):
+        """
+        Send several answers to connection with one write if possible
+        :param data: list[bytes]
+        :return: None
+        """
@@ -13,6 +13,7 @@ class ConnectorTCP(ConnectorAbstract):
         "reader", "writer",
         "_reader_queue",
         "_task_reader",
+        "_new_data_event",
         "timeout",
         "_timeout_timestamp",
         "size",
@@ -34,6 +35,7 @@ class ConnectorTCP(ConnectorAbstract):
         self.size = size
 
         self._reader_queue: Queue[bytes] = Queue()
+        self._new_data_event = asyncio.Event()
         self._task_reader = asyncio.create_task(self._reader_from_socket())
 
     @property
@@ -48,6 +50,19 @@ class ConnectorTCP(ConnectorAbstract):
     def new_data(self) -> bool:
         return not self._reader_queue.empty()
 
+    async def wait_new_data(self):
+        if self.new_data or self._task_reader.done():
+            return
+
+        self._new_data_event.clear()
+        try:
+            async with asyncio.timeout(
+                self._timeout_timestamp - time.time()
+            ):
+                await self._new_data_event.wait()
+        except TimeoutError:
+            pass
+
     def execute_bytes(self) -> bytes:
         bytes_ = bytes()
         while not self._reader_queue.empty():
@@ -67,9 +82,13 @@ class ConnectorTCP(ConnectorAbstract):
 
                 await self._reader_queue.put(data)
                 self._timeout_timestamp = self.timeout + int(time.time())
+                self._new_data_event.set()
 
         except asyncio.CancelledError:
             raise
+        finally:
+            # wake up client loop, connection is finished
+            self._new_data_event.set()
 
     @property
     def address(self) -> tuple[str, int]:
@@ -102,3 +121,14 @@ class ConnectorTCP(ConnectorAbstract):
 
         self.writer.write(data)
         await self.writer.drain()
+
+    async def send_many(self, data: list[bytes]):
+        if self.is_not_alive:
+            raise Exception("Connection was closed")
+
+        data = [answer for answer in data if answer]
+        if not data:
+            return
+
+        self.writer.writelines(data)
+        await self.writer.drain()
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from asyncio import BufferedProtocol, Transport
+from typing import Callable, Optional
+
+import logging
+from socket import socket
+
+from src.client.connector.abstract import ConnectorAbstract
+from src.utils.buffer import Buffer
+
+
+class ConnectorTCPProtocol(BufferedProtocol, ConnectorAbstract):
+    """
+    TCP connector on asyncio.BufferedProtocol
+    Socket data is read (recv_into) directly into client Buffer,
+    without reader task, queue and StreamReader/StreamWriter
+    """
+    __slots__ = (
+        "transport",
+        "buffer",
+        "timeout",
+        "_timeout_timestamp",
+        "size",
+        "_on_connection_made",
+        "_new_data",
+        "_new_data_event",
+        "_address",
+        "_closed",
+        "_drain_waiter",
+    )
+
+    def __init__(
+            self,
+            on_connection_made: Callable[['ConnectorTCPProtocol'], None],
+            timeout: int = 1200,  # default 10 min
+            size: int = 1024 * 64,  # max bytes for one read
+    ):
+        self.transport: Optional[Transport] = None
+        # set in on_connection_made callback, before first read
+        self.buffer: Optional[Buffer] = None
+
+        self.timeout = timeout
+        self._timeout_timestamp = timeout + int(time.time())
+
+        self.size = size
+
+        self._on_connection_made = on_connection_made
+        self._new_data = False
+        self._new_data_event = asyncio.Event()
+        self._address: tuple[str, int] = ('', 0)
+        self._closed = asyncio.get_running_loop().create_future()
+        self._drain_waiter: Optional[asyncio.Future] = None
+
+    def connection_made(self, transport: Transport):    # type: ignore
+        self.transport = transport
+        self._address = transport.get_extra_info('peername')
+        self._on_connection_made(self)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.buffer.get_buffer(self.size)
+
+    def buffer_updated(self, nbytes: int):
+        self.buffer.buffer_updated(nbytes)
+
+        self._timeout_timestamp = self.timeout + int(time.time())
+        self._new_data = True
+        self._new_data_event.set()
+
+    def eof_received(self) -> bool:
+        # close transport
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]):
+        if exc:
+            logging.debug(f'Connection lost {self._address} {exc}')
+
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+        self._wake_drain_waiter()
+        # wake up client loop, connection is finished
+        self._new_data_event.set()
+
+    def pause_writing(self):
+        if self._drain_waiter is None:
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+
+    def resume_writing(self):
+        self._wake_drain_waiter()
+
+    def _wake_drain_waiter(self):
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    @property
+    def is_not_alive(self) -> bool:
+        return (
+            self._closed.done()
+            or
+            int(time.time()) > self._timeout_timestamp
+        )
+
+    @property
+    def new_data(self) -> bool:
+        return self._new_data
+
+    async def wait_new_data(self):
+        if self._new_data or self._closed.done():
+            return
+
+        self._new_data_event.clear()
+        try:
+            async with asyncio.timeout(
+                self._timeout_timestamp - time.time()
+            ):
+                await self._new_data_event.wait()
+        except TimeoutError:
+            pass
+
+    def execute_bytes(self) -> bytes:
+        # data already in client buffer
+        self._new_data = False
+        return b''
+
+    @property
+    def socket(self) -> socket:
+        return self.transport.get_extra_info('socket')
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._address
+
+    async def close_connection(self):
+        if self.transport is None:
+            return
+
+        self.transport.close()
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(self._closed),
+                timeout=10
+            )
+        except asyncio.TimeoutError:
+            logging.debug('Close client connection')
+            self.transport.abort()
+
+    async def send(self, data: bytes):
+        if self.is_not_alive:
+            raise Exception("Connection was closed")
+
+        if not data:
+            return
+
+        self.transport.write(data)
+        if self._drain_waiter is not None:
+            await asyncio.shield(self._drain_waiter)
+
+    async def send_many(self, data: list[bytes]):
+        if self.is_not_alive:
+            raise Exception("Connection was closed")
+
+        data = [answer for answer in data if answer]
+        if not data:
+            return
+
+        self.transport.writelines(data)
+        if self._drain_waiter is not None:
+            await asyncio.shield(self._drain_waiter)
@@ -19,6 +19,7 @@ class ConnectorUDP(ConnectorAbstract):
 
         self._data = bytes()
         self._is_not_alive = False
+        self._new_data_event = asyncio.Event()
 
         self.__transport = transport
 
@@ -37,6 +38,19 @@ class ConnectorUDP(ConnectorAbstract):
     def new_data(self) -> bool:
         return True if self._data else False
 
+    async def wait_new_data(self):
+        if self.new_data or self._is_not_alive:
+            return
+
+        self._new_data_event.clear()
+        try:
+            async with asyncio.timeout(
+                self._timeout_timestamp - time.time()
+            ):
+                await self._new_data_event.wait()
+        except TimeoutError:
+            pass
+
     def execute_bytes(self) -> bytes:
         data = self._data[:]
         self._data = bytes()
@@ -53,12 +67,21 @@ class ConnectorUDP(ConnectorAbstract):
 
     async def close_connection(self):
         self._is_not_alive = True
+        self._new_data_event.set()
         await asyncio.sleep(0)
 
     async def send(self, data: bytes):
         self.__transport.sendto(data, (self._ip, self._port))
         await asyncio.sleep(0)
 
+    async def send_many(self, data: list[bytes]):
+        # every answer is own datagram
+        for answer in data:
+            if answer:
+                self.__transport.sendto(answer, (self._ip, self._port))
+        await asyncio.sleep(0)
+
     def update(self, data: bytes):
         self._data += data
         self._timeout_timestamp = self.timeout + int(time.time())
+        self._new_data_event.set()
@@ -11,6 +11,29 @@ from src.utils.message import Message, LoginMessage, Navigation, LBS
 from src.utils.unit import Unit
 
 
+def _bits_table(prefix: str) -> tuple[dict[str, int], ...]:
+    return tuple(
+        {
+            f"{prefix}{num}": int(val)
+            for num, val
+            in enumerate(f"{value:b}"[::-1])
+        }
+        for value in range(256)
+    )
+
+
+# state of bits for inputs (outputs) value of one byte
+_INPUTS = _bits_table('in_')
+_OUTPUTS = _bits_table('out_')
+
+# params of message: 1 - int, 2 - float, 3 - string
+_PARAM_TYPES = {
+    b'1': int,
+    b'2': float,
+    b'3': bytes.decode,
+}
+
+
 class WialonIPSv2(AbstractProtocol):
     START_BIT_PACKET: bytes = b'#'
     END_BIT_PACKET: bytes = b'\r\n'
@@ -47,14 +70,26 @@ class WialonIPSv2(AbstractProtocol):
     ) -> bytes:
         return b'%b\r\n' % command
 
+    @staticmethod
+    def _tokenize(bytes_: bytes) -> tuple[bytes, bytes, bytes]:
+        """
+        Boundaries of packet #type#body;crc\r\n
+        :return: packet type, body with last ';' (data of crc), crc
+        """
+        type_end = bytes_.index(b'#', 1)
+        body_end = bytes_.rindex(b';') + 1
+        return (
+            bytes_[1:type_end],
+            bytes_[type_end + 1:body_end],
+            bytes_[body_end:-2],
+        )
+
     def check_crc_login(
             self,
             bytes_: bytes,
             unit: Unit,
     ) -> bool:
-        body, crc = bytes_.rsplit(b';', 1)
-        body = body[3:] + b';'
-        crc = crc[:-2]
+        _, body, crc = self._tokenize(bytes_)
         return int(crc, 16) == crc16.arc(body)
 
     def check_crc_data(
@@ -62,7 +97,10 @@ class WialonIPSv2(AbstractProtocol):
             bytes_: bytes,
             unit: Unit,
     ) -> bool:
-        return self.check_crc_login(bytes_=bytes_, unit=unit)
+        packet_type, body, crc = self._tokenize(bytes_)
+        # reused by parsing_packet of the same packet
+        unit.metadata.wialon_tokens = bytes_, packet_type, body
+        return int(crc, 16) == crc16.arc(body)
 
     def answer_login_packet(
             self,
@@ -104,89 +142,101 @@ class WialonIPSv2(AbstractProtocol):
             bytes_: bytes,
             unit: Unit,
     ) -> MessageAnnotated:
-        _, packet_type, data = bytes_.split(b'#')
+        tokens = vars(unit.metadata).get('wialon_tokens')
+        if tokens is not None and tokens[0] is bytes_:
+            _, packet_type, body = tokens
+        else:
+            packet_type, body, _ = self._tokenize(bytes_)
 
         packets = None
         match packet_type:
-            case b'D':
-                packets = [self._parse_packet_d(data)]
-            case b'SD':
-                packets = [self._parse_packet_sd(data)]
+            case b'D' | b'SD':
+                packets = [self._parse_message(body[:-1].split(b';'))]
             case b'B':
-                packets = self._parse_packet_b(data)
+                # black box can have hundreds of messages, decoded lazily
+                packets = (
+                    self._parse_message(message.split(b';'))
+                    for message in body[:-1].split(b'|')
+                )
 
         unit.metadata.last_type_packet = packet_type
         return packets
 
-    def _parse_packet_sd(self, bytes_: bytes) -> Message:
-        message = self._get_base_data(*bytes_.split(b';', 10))
-        return message
+    def _parse_message(self, fields: list[bytes]) -> Message:
+        """
+        Short (SD) or full (D) message, black box has both
+        """
+        if len(fields) == 10:
+            return self._get_base_data(*fields)
 
-    def _parse_packet_d(self, bytes: bytes) -> Message:
         (
             date, _time,
             lat, lat_dir, lon, lon_dir,
             speed, course, alt, sats, hdop,
-            inputs, outputs, adc, ibutton, params, _
-        ) = bytes.split(b';', 17)
+            inputs, outputs, adc, ibutton, params
+        ) = fields
 
         message = self._get_base_data(
             date, _time,
             lat, lat_dir, lon, lon_dir,
-            speed, course, alt, sats
+            speed, course, alt, sats,
         )
 
         if hdop_ := float(hdop) if hdop != self._EMPTY else None:
             message.lbs = LBS(hdop=hdop_)
 
-        message.parameters.update({
-            'ibutton': str(ibutton) if ibutton != self._EMPTY else None
-        })
+        parameters = {
+            'ibutton': ibutton.decode() if ibutton != self._EMPTY else None
+        }
 
         if self._EMPTY != inputs and inputs:
-            message.parameters.update({
-                f"in_{num}": int(val)
-                for num, val
-                in enumerate(f"{int(inputs):b}"[::-1])
-            })
+            parameters.update(self._get_bits(inputs, _INPUTS, 'in_'))
 
         if self._EMPTY != outputs and outputs:
-            message.parameters.update({
-                f"out_{num}": int(val)
-                for num, val
-                in enumerate(f"{int(outputs):b}"[::-1])
-            })
+            parameters.update(self._get_bits(outputs, _OUTPUTS, 'out_'))
 
         if self._EMPTY != adc and adc:
-            message.parameters.update({
+            parameters.update({
                 f"adc_{num}": float(val)
                 for num, val
                 in enumerate(adc.split(b','))
             })
 
         if self._EMPTY != params and params:
-            list_parameters = list()
-            for param in params.split(b","):
-                if param:
-                    p_name, p_type, p_val = param.split(b":", 2)
-                    list_parameters.append(
-                        {
-                            "name": str(p_name),
-                            "type": str(p_type),
-                            "value": str(p_val)
-                        }
-                    )
-            message.parameters.update({'parameters': list_parameters})
-        return message
-
-    def _parse_packet_b(self, bytes_: bytes) -> list[Message]:
-        ready_packets = list()
+            parameters['parameters'] = [
+                {
+                    "name": p_name.decode(),
+                    "type": int(p_type),
+                    "value": _PARAM_TYPES.get(p_type, bytes.decode)(p_val),
+                }
+                for p_name, p_type, p_val in (
+                    param.split(b":", 2)
+                    for param in params.split(b",")
+                    if param
+                )
+            ]
 
-        packets_b = bytes_.split(b'|')
-        for packet in packets_b:
-            ready_packets.append(self._parse_packet_sd(packet))
+        message.parameters.update(parameters)
+        return message
 
-        return ready_packets
+    @staticmethod
+    def _get_bits(
+            value: bytes,
+            table: tuple[dict[str, int], ...],
+            prefix: str,
+    ) -> dict[str, int]:
+        """
+        State of every bit of inputs (outputs) up to the highest set bit
+        """
+        value_ = int(value)
+        if value_ < len(table):
+            return table[value_]
+
+        return {
+            f"{prefix}{num}": int(val)
+            for num, val
+            in enumerate(f"{value_:b}"[::-1])
+        }
 
     def _get_base_data(self, *args) -> Message:
         (
@@ -209,14 +259,15 @@ class WialonIPSv2(AbstractProtocol):
 
     def _get_time(self, date: bytes, time_: bytes) -> datetime:
         if self._EMPTY not in (date, time_):
+            date_, time__ = int(date), int(time_)
             return datetime(
-                    year=int(date[4:6]) + 2000,
-                    month=int(date[2:4]),
-                    day=int(date[0:2]),
-                    hour=int(time_[0:2]),
-                    minute=int(time_[2:4]),
-                    second=int(time_[4:6])
-                )
+                year=date_ % 100 + 2000,
+                month=date_ // 100 % 100,
+                day=date_ // 10000,
+                hour=time__ // 10000,
+                minute=time__ // 100 % 100,
+                second=time__ % 100,
+            )
         return datetime.now()
 
     def _get_lat(self, lat: bytes, lat_dir: bytes) -> float:
@@ -228,6 +279,6 @@ class WialonIPSv2(AbstractProtocol):
     def _get_lon(self, lon: bytes, lon_dir: bytes) -> float:
         if self._EMPTY not in (lon, lon_dir):
             direction = 1 if lon_dir == b'E' else -1
-            return (int(lon[:3]) + float(lon[3:])) * direction
+            return (int(lon[:3]) + float(lon[3:]) / 60.) * direction
 
         return 0.0
@@ -1,11 +1,12 @@
 from abc import abstractmethod, ABCMeta
+from collections.abc import Iterator
 from typing import Optional, Union
 
 from src.status import StatusAuth, StatusException, StatusParsing
 from src.utils.message import LoginMessage, Message
 from src.utils.unit import Unit
 
-MessageAnnotated = Union[list[Message], Message, None]
+MessageAnnotated = Union[list[Message], Iterator[Message], Message, None]
 
 
 class ProtocolInterface(object, metaclass=ABCMeta):
@@ -57,6 +58,10 @@ class ProtocolInterface(object, metaclass=ABCMeta):
             unit: Unit,
     ) -> MessageAnnotated:
         """
+        Messages can be returned by iterator (generator) for packets
+        with many records, they are published by chunks while decoding.
+        Data for answer (unit.metadata) must be set before return,
+        not inside generator
         :param bytes_:
         :param unit:
         :return:
@@ -137,15 +142,17 @@ class ProtocolInterface(object, metaclass=ABCMeta):
     @abstractmethod
     def custom_start_end_login(self, data: bytes) -> tuple[int, int]:
         """
-        :param data:
-        :return:
+        Used when login packet can't be found by start/end bits
+        :param data: memoryview of received data
+        :return: (start, end) of packet, end beyond data if not complete
         """
 
     @abstractmethod
     def custom_start_end_packet(self, data: bytes) -> tuple[int, int]:
         """
-        :param data:
-        :return:
+        Used when data packet can't be found by start/end bits
+        :param data: memoryview of received data
+        :return: (start, end) of packet, end beyond data if not complete
         """
 
     @abstractmethod
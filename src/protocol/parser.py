@@ -20,6 +20,21 @@ class SizeCleaner:
     end: int = field(default=-0)
 
 
+@dataclass
+class ScanState:
+    """
+    Framing progress of one connection, offsets relative to buffer start
+    start: confirmed start of packet (-1 if not found yet)
+    searched: data before this offset already searched
+    """
+    start: int = field(default=-1)
+    searched: int = field(default=0)
+
+    def reset(self):
+        self.start = -1
+        self.searched = 0
+
+
 class PacketParser:
     def __init__(self, protocol: AbstractProtocol):
         self._p = protocol
@@ -30,7 +45,7 @@ class PacketParser:
     def __repr__(self):
         return f"<Packet parser ({self._p.TYPE})>"
 
-    def __get_login_parser(self) -> Callable[[bytes], SizeCleaner]:
+    def __get_login_parser(self) -> Callable[[Buffer], SizeCleaner]:
         return self.__get_parser(
             start=self._p.START_BIT_LOGIN,
             end=self._p.END_BIT_LOGIN,
@@ -38,7 +53,7 @@ class PacketParser:
             custom=self._p.custom_start_end_login
         )
 
-    def __get_packet_parser(self) -> Callable[[bytes], SizeCleaner]:
+    def __get_packet_parser(self) -> Callable[[Buffer], SizeCleaner]:
         return self.__get_parser(
             start=self._p.START_BIT_PACKET,
             end=self._p.END_BIT_PACKET,
@@ -52,7 +67,7 @@ class PacketParser:
             len_: Optional[int] = None,
             start: Optional[bytes] = None,
             end: Optional[bytes] = None,
-    ) -> Callable[[bytes], SizeCleaner]:
+    ) -> Callable[[Buffer], SizeCleaner]:
         if start and end and len_:
             return self.__start_end_len(
                 start=start,
@@ -65,95 +80,149 @@ class PacketParser:
                 end=end,
             )
         else:
-            return custom
+            return self.__custom(
+                custom=custom
+            )
+
+    @staticmethod
+    def __custom(
+            custom: Callable[[memoryview], tuple[int, int]],
+    ) -> Callable[[Buffer], SizeCleaner]:
+
+        def func(buffer: Buffer) -> SizeCleaner:
+            with buffer.view() as view:
+                start_, end_ = custom(view)
+
+            if end_ > len(buffer):
+                # packet is not complete
+                return SizeCleaner(
+                    need_clear=True,
+                    clear_end=0,
+                )
+
+            return SizeCleaner(
+                need_clear=True,
+                clear_end=end_,
+                start=start_,
+                end=end_,
+            )
+
+        return func
 
     @staticmethod
+    def __find_start(
+            buffer: Buffer,
+            state: ScanState,
+            start: bytes,
+    ) -> Optional[SizeCleaner]:
+        """
+        Search start bits from last searched offset
+        If start not found, drop garbage but keep tail which can be
+        beginning of start bits, so every byte is searched once
+        """
+        if state.searched > len(buffer):
+            # buffer was cleared outside of parser
+            state.reset()
+
+        if state.start != -1:
+            return None
+
+        index = buffer.find(start, state.searched)
+        if index == -1:
+            keep = min(len(start) - 1, len(buffer))
+            state.reset()
+            return SizeCleaner(
+                need_clear=True,
+                clear_end=len(buffer) - keep,
+            )
+
+        state.start = index
+        state.searched = index + len(start)
+        return None
+
+    @classmethod
     def __start_end_len(
+            cls,
             start: bytes,
             end: bytes,
             len_: int
-    ) -> Callable[[bytes], SizeCleaner]:
+    ) -> Callable[[Buffer], SizeCleaner]:
         START = start
         END = end
         LEN = len_
+        state = ScanState()
+
+        def func(buffer: Buffer) -> SizeCleaner:
+            not_found = cls.__find_start(buffer, state, START)
+            if not_found:
+                return not_found
+
+            start_ = state.start
+            if len(buffer) - start_ < LEN + len(END):
+                # wait full packet, drop garbage before start
+                state.start = 0
+                state.searched = len(START)
+                return SizeCleaner(
+                    need_clear=True,
+                    clear_end=start_,
+                )
 
-        def func(bytes_: bytes) -> SizeCleaner:
-            start_ = 0
-            while True:
-
-                if not bytes_.startswith(START, start_):
-                    index = bytes_.find(START, start_)
-
-                    if index == -1:
-                        return SizeCleaner(
-                            need_clear=True
-                        )
-                    else:
-                        start_ += index
-                        continue
-
-                if len(bytes_[start_:]) < LEN:
-                    return SizeCleaner(
-                        need_clear=True,
-                        clear_end=start_,
-                    )
-
-                s = start_ + LEN
-                full = s + len(END)
-                if bytes_[s:full] == END:
-                    return SizeCleaner(
-                        need_clear=True,
-                        clear_end=full,
-                        start=start_,
-                        end=full,
-                    )
-                else:
-                    return SizeCleaner(
-                        need_clear=True,
-                        clear_end=full,
-                    )
+            state.reset()
+            full = start_ + LEN + len(END)
+            if buffer.startswith(END, start_ + LEN):
+                return SizeCleaner(
+                    need_clear=True,
+                    clear_end=full,
+                    start=start_,
+                    end=full,
+                )
+            else:
+                return SizeCleaner(
+                    need_clear=True,
+                    clear_end=full,
+                )
 
         return func
 
-    @staticmethod
+    @classmethod
     def __start_end(
+            cls,
             start: bytes,
             end: bytes,
-    ) -> Callable[[bytes], SizeCleaner]:
+    ) -> Callable[[Buffer], SizeCleaner]:
         START = start
         END = end
+        state = ScanState()
 
-        def func(bytes_: bytes) -> SizeCleaner:
-            start_ = 0
-            end_ = 0
-            while True:
-
-                if not bytes_.startswith(START, start_):
-                    index = bytes_.find(START, start_)
+        def func(buffer: Buffer) -> SizeCleaner:
+            not_found = cls.__find_start(buffer, state, START)
+            if not_found:
+                return not_found
 
-                    if index == -1:
-                        return SizeCleaner(need_clear=True)
-                    else:
-                        start_ += index
-                        end_ += index
-                        continue
-
-                index = bytes_.find(END, start_)
-
-                if index == -1:
-                    return SizeCleaner(
-                        need_clear=True,
-                        clear_end=start_,
-                    )
+            start_ = state.start
+            index = buffer.find(
+                END,
+                max(state.searched - len(END) + 1, start_ + len(START))
+            )
 
-                packet_len = len(bytes_[:index + len(END)])
+            if index == -1:
+                # wait end of packet, drop garbage before start
+                state.start = 0
+                state.searched = len(buffer) - start_
                 return SizeCleaner(
                     need_clear=True,
-                    clear_end=packet_len,
-                    start=start_,
-                    end=packet_len,
+                    clear_end=start_,
                 )
 
+            state.reset()
+            packet_len = index + len(END)
+            return SizeCleaner(
+                need_clear=True,
+                clear_end=packet_len,
+                start=start_,
+                end=packet_len,
+            )
+
         return func
 
     @exception_wrapper
@@ -163,17 +232,18 @@ class PacketParser:
             unit: Unit,
     ) -> Optional[tuple[Status, MessageAnnotated, bytes]]:
 
-        bytes_ = buffer.get_all()
         if unit.is_authorized:
-            packet_size = self._packet(bytes_)
+            packet_size = self._packet(buffer)
         else:
-            packet_size = self._login(bytes_)
+            packet_size = self._login(buffer)
+
+        bytes_ = b''
+        if 0 <= packet_size.start < packet_size.end:
+            bytes_ = buffer.read(packet_size.start, packet_size.end)
 
         if packet_size.need_clear:
             buffer.clear(packet_size.clear_end)
 
-        bytes_ = bytes_[packet_size.start:packet_size.end]
-
         if not bytes_:
             return None
 
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 from ..abstract import AbstractProtocol
@@ -6,37 +9,75 @@ import struct
 from src.status.auth import StatusAuth
 from src.status.parsing import StatusParsing
 from fastcrc import crc16
-from itertools import islice
 
 import logging
 
+from .vectorized import TeltonikaBatch, decode_codec_8, np
 from ..interface import MessageAnnotated
 from ...utils.message import LoginMessage, Message, Navigation
-from ...utils.meta import MetaData
 from ...utils.unit import Unit
 
+# codec id, count of records (packet without preamble)
+_HEADER = struct.Struct('>4xBB')
+# timestamp, priority, longitude, latitude, altitude, angle, satellites, speed
+_RECORD = struct.Struct('>QBiiHHBH')
 
-def batched(iterable, n):
-    """Batch data into lists of length n. The last batch may be shorter."""
-    # batched('ABCDEFG', 3) --> ABC DEF G
-    if n < 1:
-        raise ValueError('n must be >= 1')
-    it = iter(iterable)
-    while batch := list(islice(it, n)):
-        yield batch
+# event io id, total count of io
+_IO_HEADER_8 = struct.Struct('>BB')
+_IO_HEADER_8E = struct.Struct('>HH')
+
+_COUNT_8 = struct.Struct('>B')
+_COUNT_8E = struct.Struct('>H')
+
+# size of (io id, io value) for io of 1, 2, 4, 8 bytes
+_IO_8_SIZES = (2, 3, 5, 9)
+_IO_8E_SIZES = (3, 4, 6, 10)
+
+# io id, length of value for variable length io (codec 8E)
+_IO_NX = struct.Struct('>HH')
 
 
 class Teltonika(AbstractProtocol):
     START_BIT_LOGIN = b'\x00'
     START_BIT_PACKET = b'\x00\x00\x00\x00'
 
+    TYPE = 'teltonika'
+
+    def __init__(
+            self,
+            io_plan_cache_size: int = 256,
+            vectorized: bool = False,
+    ):
+        """
+        :param io_plan_cache_size: max count of cached IO layout plans,
+        devices of one fleet send the same layout in every record
+        :param vectorized: decode codec 8 packets by NumPy,
+        pure python decoder is used if NumPy is not installed
+        """
+        self._io_plan = lru_cache(maxsize=io_plan_cache_size)(
+            self._compile_io_plan
+        )
+
+        if vectorized and np is None:
+            logging.warning("NumPy is not installed, vectorized is disabled")
+        self.vectorized = vectorized and np is not None
+
     def __str__(self):
         return 'Teltonika'
 
+    def __repr__(self):
+        return 'Teltonika'
+
     def custom_start_end_login(self, data: bytes) -> tuple[int, int]:
+        if len(data) < 2:
+            # length of imei not received yet
+            return 2, 3
         return 2, struct.unpack('>H', data[:2])[0] + 2
 
     def custom_start_end_packet(self, data: bytes) -> tuple[int, int]:
+        if len(data) < 8:
+            # length of data not received yet
+            return 4, 13
         return 4, 12 + struct.unpack('>L', data[4:8])[0]
 
     def parsing_login_packet(
@@ -78,170 +119,162 @@ class Teltonika(AbstractProtocol):
             bytes_data: bytes,
             unit: Unit,
     ) -> MessageAnnotated:
-
-        len_packet = len(bytes_data) - 11
-        codec_id, number_data_1, number_data_2 = struct.unpack(
-            f'>4x2B{len_packet}x1s4x',
-            bytes_data
-        )
-        unit.metadata.all_count_packet = number_data_2
+        """
+        Packet without preamble:
+        data length (4), codec id (1), count (1), records, count (1), crc (4)
+        Records are decoded by generator while messages are published
+        """
+        codec_id, count = _HEADER.unpack_from(bytes_data)
+        unit.metadata.all_count_packet = bytes_data[-5:-4]
 
         match codec_id:
+            case 0x08 if self.vectorized:
+                return decode_codec_8(bytes_data, count).to_messages()
             case 0x08:
-                packets = self._parsing_codec_8(bytes_data[6:-5])
+                return self._parsing_codec_8(bytes_data, count)
             case 0x8e:
-                packets = self._parsing_codec_8e(bytes_data[6:-5])
+                return self._parsing_codec_8e(bytes_data, count)
             case _:
                 logging.debug("Warning, unknown codec_id!")
-                packets = list()
+                return list()
 
-        return packets
+    def parsing_packet_batch(
+            self,
+            bytes_data: bytes,
+            unit: Unit,
+    ) -> TeltonikaBatch:
+        """
+        Columnar records of codec 8 packet, NumPy is required
+        :param bytes_data: packet without preamble
+        :param unit:
+        :return:
+        """
+        codec_id, count = _HEADER.unpack_from(bytes_data)
+        if codec_id != 0x08:
+            raise ValueError(f"Batch decoding of codec {codec_id:#x}")
+
+        unit.metadata.all_count_packet = bytes_data[-5:-4]
+        return decode_codec_8(bytes_data, count)
+
+    def io_plan_cache_info(self):
+        """
+        Hits, misses and size of IO layout plan cache
+        :return: functools._CacheInfo
+        """
+        return self._io_plan.cache_info()
 
     @staticmethod
-    def _get_len_packets(bytes_data: bytes) -> int:
-        return struct.unpack('B', bytes_data[0:1])[0]
+    def _compile_io_plan(layout: tuple[int, ...]) -> struct.Struct:
+        """
+        Struct for whole fixed part of record with given IO layout:
+        record, io header and (io id, io value) pairs,
+        counts of io groups are skipped by pad bytes
+        :param layout: codec id, count of io with 1, 2, 4, 8 bytes values
+        :return:
+        """
+        codec_id, *counts = layout
+        if codec_id == 0x08:
+            io_id, pad, header = 'B', 'x', 'BB'
+        else:
+            io_id, pad, header = 'H', 'xx', 'HH'
+
+        return struct.Struct(
+            _RECORD.format
+            + header
+            + ''.join(
+                pad + (io_id + value) * count
+                for value, count in zip('BHIQ', counts)
+            )
+        )
 
     @staticmethod
-    def _get_name_value(
-            bd: bytes,
-            struct_str: str,
-            len_sub_packet: int,
-            packet_name: str = 'B'
-    ) -> dict:
-        batch = batched(
-            struct.unpack(
-                f">{len_sub_packet * f'{packet_name}{struct_str}'}",
-                bd
+    def _message(
+            record: tuple[int, ...],
+            params: dict,
+    ) -> Message:
+        time_, _, lon, lat, alt, angle, sats, speed = record[:8]
+
+        return Message(
+            time_=datetime.fromtimestamp(time_ / 1000, tz=timezone.utc),
+            navigation=Navigation(
+                latitude=lat / 10_000_000,
+                longitude=lon / 10_000_000,
+                altitude=float(alt),
+                course=angle,
+                satellites=sats,
+                speed=speed,
             ),
-            n=2
+            parameters=params,
         )
-        return dict(batch)
 
-    def _parsing_codec_8(self, bytes_data: bytes) -> MessageAnnotated:
-        packets_return = list()
-
-        while bytes_data:
-            params = dict()
-
-            time_, priority = struct.unpack('>QB', bytes_data[:9])
-            lon, lat, alt, angle, sats, speed = self._gps_data(
-                bytes_data[9:24])
-
-            event_io_id, n_total_id = struct.unpack('>2B', bytes_data[24:26])
-            bytes_data = bytes_data[26:]
-            len_value = 1
-
-            for _ in range(4):
-                len_sub_p = bytes_data[0]
-                dict_values = self._get_name_value(
-                    bd=bytes_data[1:1 + len_sub_p + len_sub_p * len_value],
-                    struct_str={1: 'B', 2: 'H', 4: 'I', 8: 'Q'}[len_value],
-                    len_sub_packet=len_sub_p,
-                )
-                params.update(dict_values)
-
-                bytes_data = bytes_data[1 + len_sub_p + len_sub_p * len_value:]
-
-                n_total_id -= len_sub_p
-                len_value *= 2
-
-            packets_return.append(
-                Message(
-                    time_=time_,
-                    navigation=Navigation(
-                        latitude=lat,
-                        longitude=lon,
-                        altitude=alt,
-                        course=angle,
-                        satellites=sats,
-                        speed=speed,
-                    ),
-                    parameters={
-                        'priority': priority,
-                        **params,
-                    }
+    def _parsing_record(
+            self,
+            view: memoryview,
+            offset: int,
+            codec_id: int,
+            params: dict,
+    ) -> tuple[tuple[int, ...], int]:
+        """
+        Read record and io with 1, 2, 4, 8 bytes values into params
+        :return: record values, offset after last io group
+        """
+        if codec_id == 0x08:
+            count_struct, io_sizes = _COUNT_8, _IO_8_SIZES
+            layout_offset = offset + _RECORD.size + _IO_HEADER_8.size
+        else:
+            count_struct, io_sizes = _COUNT_8E, _IO_8E_SIZES
+            layout_offset = offset + _RECORD.size + _IO_HEADER_8E.size
+
+        layout = [codec_id]
+        for io_size in io_sizes:
+            count, = count_struct.unpack_from(view, layout_offset)
+            layout.append(count)
+            layout_offset += count_struct.size + count * io_size
+
+        plan = self._io_plan(tuple(layout))
+        values = plan.unpack_from(view, offset)
+
+        io = iter(values[10:])
+        params.update(zip(io, io))
+        return values, offset + plan.size
+
+    def _parsing_codec_8(
+            self,
+            bytes_data: bytes,
+            count: int,
+    ) -> Iterator[Message]:
+        with memoryview(bytes_data) as view:
+            offset = 6
+            for _ in range(count):
+                params = {'priority': view[offset + 8]}
+                record, offset = self._parsing_record(
+                    view, offset, 0x08, params
                 )
-            )
-
-        return packets_return
-
-    @staticmethod
-    def _gps_data(
-            bytes_data: bytes
-    ) -> tuple[float, float, int, int, int, int]:
-        lon, lat, alt, angle, sats, speed = struct.unpack(
-            '>2I2H1B1H',
-            bytes_data
-        )
-        direction = -1 if lat >> 31 else 1
-        lat = (lat & 0x7F_FF_FF_FF * direction) / 10_000_000
-        lon = (lon & 0x7F_FF_FF_FF * direction) / 10_000_000
-        return lon, lat, alt, angle, sats, speed
-
-    def _parsing_codec_8e(self, bytes_data: bytes) -> MessageAnnotated:
-        packets_return = list()
-
-        while bytes_data:
-            params = dict()
-
-            time_, priority = struct.unpack('>QB', bytes_data[:9])
-            lon, lat, alt, angle, sats, speed = self._gps_data(
-                bytes_data[9:24])
+                yield self._message(record, params)
 
-            event_io_id, n_total_id = struct.unpack('>2H', bytes_data[24:28])
-            bytes_data = bytes_data[28:]
-            len_value = 1
-
-            for _ in range(5):
-
-                if len_value > 8:
-                    count_extend, = struct.unpack('>H', bytes_data[0:2])
-                    bytes_data = bytes_data[2:]
-                    while count_extend:
-                        name, len_value = struct.unpack('>2H', bytes_data[0:4])
-
-                        params[name] = bytes_data[4:len_value + 4].hex()
-                        bytes_data = bytes_data[len_value + 4:]
-                        count_extend -= 1
-
-                    break
+    def _parsing_codec_8e(
+            self,
+            bytes_data: bytes,
+            count: int,
+    ) -> Iterator[Message]:
+        with memoryview(bytes_data) as view:
+            offset = 6
+            for _ in range(count):
+                params = {'priority': view[offset + 8]}
+                record, offset = self._parsing_record(
+                    view, offset, 0x8e, params
+                )
 
-                len_sub_p, = struct.unpack('>H', bytes_data[0:2])
-                _len_value = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}[len_value]
+                count_extend, = _COUNT_8E.unpack_from(view, offset)
+                offset += _COUNT_8E.size
+                for _ in range(count_extend):
+                    name, len_value = _IO_NX.unpack_from(view, offset)
+                    offset += _IO_NX.size
 
-                dict_values = self._get_name_value(
-                    bd=bytes_data[2:2 + len_sub_p * 2 + len_sub_p * len_value],
-                    struct_str=_len_value,
-                    len_sub_packet=len_sub_p,
-                    packet_name='H'
-                )
-                params.update(dict_values)
-
-                bytes_data = bytes_data[
-                             2 + len_sub_p * 2 + len_sub_p * len_value:]
-
-                n_total_id -= len_sub_p
-                len_value *= 2
-
-            packets_return.append(
-                Message(
-                    time_=time_,
-                    navigation=Navigation(
-                        latitude=lat,
-                        longitude=lon,
-                        altitude=alt,
-                        course=angle,
-                        satellites=sats,
-                        speed=speed,
-                    ),
-                    parameters={
-                        'priority': priority,
-                        **params,
-                    }
-                )
-            )
+                    params[name] = view[offset:offset + len_value].hex()
+                    offset += len_value
 
-        return packets_return
+                yield self._message(record, params)
 
     def answer_packet(
             self,
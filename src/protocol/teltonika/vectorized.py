@@ -0,0 +1,193 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from ...utils.message import Message, Navigation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# record without io: timestamp, priority, longitude, latitude,
+# altitude, angle, satellites, speed
+_RECORD_SIZE = 24
+# event io id, total count of io
+_IO_HEADER_SIZE = 2
+# size of io value for groups of io
+_IO_WIDTHS = (1, 2, 4, 8)
+
+if np is not None:
+    _RECORD = np.dtype([
+        ('time_', '>u8'),
+        ('priority', 'u1'),
+        ('longitude', '>i4'),
+        ('latitude', '>i4'),
+        ('altitude', '>u2'),
+        ('course', '>u2'),
+        ('satellites', 'u1'),
+        ('speed', '>u2'),
+    ])
+    _IO = tuple(
+        np.dtype([('id', 'u1'), ('value', f'>u{width}')])
+        for width in _IO_WIDTHS
+    )
+
+
+@dataclass
+class TeltonikaBatch:
+    """
+    Columnar records of one codec 8 packet
+    Time in milliseconds, coordinates in degrees,
+    io groups: (indexes of records, io ids, io values) for every io layout
+    """
+    time_: 'np.ndarray'
+    priority: 'np.ndarray'
+    latitude: 'np.ndarray'
+    longitude: 'np.ndarray'
+    altitude: 'np.ndarray'
+    course: 'np.ndarray'
+    satellites: 'np.ndarray'
+    speed: 'np.ndarray'
+    io: list[tuple['np.ndarray', 'np.ndarray', 'np.ndarray']]
+
+    def __len__(self):
+        return len(self.time_)
+
+    def parameters(self) -> list[dict]:
+        params = [{'priority': p} for p in self.priority.tolist()]
+        for records, ids, values in self.io:
+            for record, ids_, values_ in zip(
+                    records.tolist(), ids.tolist(), values.tolist()
+            ):
+                params[record].update(zip(ids_, values_))
+        return params
+
+    def to_messages(self) -> list[Message]:
+        return [
+            Message(
+                time_=datetime.fromtimestamp(time_ / 1000, tz=timezone.utc),
+                navigation=Navigation(
+                    latitude=lat,
+                    longitude=lon,
+                    altitude=alt,
+                    course=course,
+                    satellites=sats,
+                    speed=speed,
+                ),
+                parameters=params,
+            )
+            for time_, lat, lon, alt, course, sats, speed, params in zip(
+                self.time_.tolist(),
+                self.latitude.tolist(),
+                self.longitude.tolist(),
+                self.altitude.tolist(),
+                self.course.tolist(),
+                self.satellites.tolist(),
+                self.speed.tolist(),
+                self.parameters(),
+            )
+        ]
+
+
+def _offsets(
+        bytes_data: bytes,
+        count: int,
+) -> tuple[list[int], list[tuple[int, int, int, int]]]:
+    """
+    Walk variable io sections of records
+    :return: offsets of records, count of io with 1, 2, 4, 8 bytes values
+    """
+    offsets = list()
+    layouts = list()
+
+    offset = 6
+    for _ in range(count):
+        offsets.append(offset)
+        offset += _RECORD_SIZE + _IO_HEADER_SIZE
+
+        n1 = bytes_data[offset]
+        offset += 1 + 2 * n1
+        n2 = bytes_data[offset]
+        offset += 1 + 3 * n2
+        n4 = bytes_data[offset]
+        offset += 1 + 5 * n4
+        n8 = bytes_data[offset]
+        offset += 1 + 9 * n8
+        layouts.append((n1, n2, n4, n8))
+
+    return offsets, layouts
+
+
+def _gather(raw: 'np.ndarray', starts: 'np.ndarray', dtype: 'np.dtype'):
+    """
+    Copy rows of dtype.itemsize bytes from starts into structured array
+    """
+    rows = raw[starts[:, None] + np.arange(dtype.itemsize)]
+    return rows.view(dtype)[:, 0]
+
+
+def decode_codec_8(bytes_data: bytes, count: int) -> TeltonikaBatch:
+    """
+    Decode records of codec 8 packet (without preamble)
+    Offsets of records are found by one pass over io counts,
+    then records and io of the same layout are read by NumPy at once
+    """
+    if np is None:
+        raise ImportError("NumPy is required for vectorized decoding")
+
+    offsets, layouts = _offsets(bytes_data, count)
+    raw = np.frombuffer(bytes_data, dtype=np.uint8)
+    starts = np.array(offsets, dtype=np.intp)
+
+    records = _gather(raw, starts, _RECORD)
+
+    by_layout = defaultdict(list)
+    for index, layout in enumerate(layouts):
+        by_layout[layout].append(index)
+
+    io = list()
+    for layout, indexes in by_layout.items():
+        if not any(layout):
+            continue
+
+        dtype = np.dtype([
+            field
+            for group, (width, n) in enumerate(zip(_IO_WIDTHS, layout))
+            for field in (
+                (f'count_{width}', 'u1'),
+                (f'io_{width}', _IO[group], (n,)),
+            )
+        ])
+        indexes = np.array(indexes, dtype=np.intp)
+        io_ = _gather(
+            raw,
+            starts[indexes] + _RECORD_SIZE + _IO_HEADER_SIZE,
+            dtype,
+        )
+        io.append((
+            indexes,
+            np.concatenate(
+                [io_[f'io_{width}']['id'] for width in _IO_WIDTHS], axis=1
+            ),
+            np.concatenate(
+                [
+                    io_[f'io_{width}']['value'].astype(np.uint64)
+                    for width in _IO_WIDTHS
+                ],
+                axis=1,
+            ),
+        ))
+
+    return TeltonikaBatch(
+        time_=records['time_'].astype(np.int64),
+        priority=records['priority'],
+        latitude=records['latitude'] / 10_000_000,
+        longitude=records['longitude'] / 10_000_000,
+        altitude=records['altitude'].astype(np.float64),
+        course=records['course'],
+        satellites=records['satellites'],
+        speed=records['speed'],
+        io=io,
+    )
@@ -32,10 +32,12 @@ async def run_server(
         protocol: Type[AbstractProtocol],
         authorization: AbstractAuthorization,
         server: Type[ServerAbstract] = TCPServer,
+        **kwargs
 ) -> AsyncIterator[ServerAbstract]:
     config: ServerConfig = _init_server_config(
         port=port,
         host=host,
+        **kwargs
     )
 
     if not server:
@@ -6,7 +6,9 @@ from typing import Optional
 from src.auth.abstract import AbstractAuthorization
 from src.client.connections.connection import ClientConnection, Command
 from src.client.connections.connections import ClientConnections
+from src.client.connector.abstract import T
 from src.client.connector.tcp import ConnectorTCP
+from src.client.connector.tcp_protocol import ConnectorTCPProtocol
 from src.protocol.abstract import AbstractProtocol
 from src.server.abstract import ServerAbstract
 from src.utils.config import ServerConfig
@@ -91,20 +93,32 @@ class TCPServer(ServerAbstract):
             writer: StreamWriter,
             **kwargs
     ):
-        client_conn = ClientConnection(
-            data_manager=self._data_manager,
-            protocol=self._protocol,
-            authorization=self._authorization,
+        client_conn = self._create_client_connection(
             connector=ConnectorTCP(
                 reader=reader,
                 writer=writer,
                 timeout=self.config.timeout
             ),
+            **kwargs
+        )
+        await self._run_client_connection(client_conn)
+
+    def _create_client_connection(
+            self,
+            connector: T,
+            **kwargs
+    ) -> ClientConnection:
+        return ClientConnection(
+            data_manager=self._data_manager,
+            protocol=self._protocol,
+            authorization=self._authorization,
+            connector=connector,
             server_status=self._server_is_work,
             config=self.config,
             **kwargs
         )
 
+    async def _run_client_connection(self, client_conn: ClientConnection):
         self._client_connections.add(client_conn)
         try:
             await client_conn.run_client_loop()
@@ -132,3 +146,51 @@ class TCPServer(ServerAbstract):
             )
         except asyncio.TimeoutError:
             logging.warning('Timeout error close socket')
+
+
+class TCPBufferedServer(TCPServer):
+    """
+    TCP server on asyncio.BufferedProtocol transport
+    Socket data read directly into client connection buffer,
+    connection don't use reader task, queue and StreamReader/StreamWriter
+    """
+
+    def __init__(
+            self,
+            config: ServerConfig,
+            protocol: AbstractProtocol,
+            authorization: AbstractAuthorization,
+    ):
+        super().__init__(
+            config=config,
+            protocol=protocol,
+            authorization=authorization,
+        )
+        self._client_tasks: set[asyncio.Task] = set()
+
+    async def run(self):
+        logging.info(f"Start buffered server {self._protocol}")
+
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            self._create_connector,
+            host=str(self.config.host),
+            port=self.config.port,
+            **self.config.extra,
+        )
+        await self._server.start_serving()
+        self._server_is_work.set()
+
+    def _create_connector(self) -> ConnectorTCPProtocol:
+        return ConnectorTCPProtocol(
+            on_connection_made=self._on_connection_made,
+            timeout=self.config.timeout,
+        )
+
+    def _on_connection_made(self, connector: ConnectorTCPProtocol):
+        client_conn = self._create_client_connection(connector=connector)
+        connector.buffer = client_conn.buffer
+
+        task = asyncio.create_task(self._run_client_connection(client_conn))
+        self._client_tasks.add(task)
+        task.add_done_callback(self._client_tasks.discard)
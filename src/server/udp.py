@@ -95,7 +95,7 @@ class UDPServerProtocol(asyncio.DatagramProtocol, ServerAbstract):
         else:
             client_connection = self._connection_objects[addr]
 
-        client_connection.buffer.update(data)
+        client_connection.connector.update(data)
 
     def error_received(self, exc):
         logging.exception(f'In UDP server get exception: {exc}')
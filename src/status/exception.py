@@ -32,6 +32,20 @@ class StatusException(Status):
     def __repr__(self):
         return f"<StatusException {self.err_type}>"
 
+    @classmethod
+    def from_exception(
+            cls,
+            err: Exception,
+            func_name: Optional[str],
+    ) -> StatusException:
+        return cls(
+            err=True,
+            err_type=err,
+            err_args=err.args,
+            err_str=str(err),
+            err_func_name=func_name,
+        )
+
     @property
     def correct(self) -> bool:
         return not self._err
@@ -61,13 +75,7 @@ def exception_wrapper(func):
             )
             logging.debug(tb())
 
-            status = StatusException(
-                err=True,
-                err_type=e,
-                err_args=e.args,
-                err_str=str(e),
-                err_func_name=func.__name__
-            )
+            status = StatusException.from_exception(e, func.__name__)
 
             return status, None, b''
 
@@ -3,6 +3,14 @@ from typing import Optional
 from src.protocol.abstract import AbstractProtocol
 from src.utils.config import ServerConfig
 
+# source of zero bytes for reserve space in get_buffer without allocation
+_ZEROS = bytes(1024 * 64)
+
+# consumed bytes are dropped from storage only when there are
+# at least _COMPACT_SIZE of them and they are more than half of storage,
+# so every byte is moved not more than once on average
+_COMPACT_SIZE = 1024 * 64
+
 
 class BufferOverflow(Exception):
     """
@@ -11,9 +19,17 @@ class BufferOverflow(Exception):
 
 
 class Buffer:
+    """
+    Compacting buffer of connection data
+
+    Data lives in one bytearray, consumed data is skipped by moving
+    read offset (no copy), storage is compacted from time to time.
+    All offsets in public methods are relative to the first unread byte.
+    """
 
     __slots__ = (
-        '_message', '_handler', '_max_buffer_size', '_is_not_empty'
+        '_message', '_start', '_handler', '_max_buffer_size', '_is_not_empty',
+        '_view', '_view_start',
     )
 
     def __init__(
@@ -26,19 +42,27 @@ class Buffer:
         self._max_buffer_size = config.local_buffer_size
 
         self._message = bytearray()
+        self._start = 0
         self._is_not_empty = False
         self._handler = handler
 
+        self._view: Optional[memoryview] = None
+        self._view_start = 0
+
     def __repr__(self):
         return (
             f"Buffer("
-            f"msgs_len={len(self._message)}, "
+            f"msgs_len={len(self)}, "
             f"max_buffer_size={self._max_buffer_size}"
             f")"
         )
 
+    def __len__(self) -> int:
+        return len(self._message) - self._start
+
     def update(self, bytes_: bytes):
-        if len(self._message) > self._max_buffer_size:
+        self._release_view()
+        if len(self) > self._max_buffer_size:
             raise BufferOverflow
 
         self._message.extend(bytes_)
@@ -54,18 +78,112 @@ class Buffer:
     ):
         """
         Make cleaning of data buffer
+        Negative len_to_clear keep last abs(len_to_clear) bytes
         :param len_to_clear: int
         :return: None
         """
+        self._release_view()
         if isinstance(len_to_clear, int):
-            self._message = self._message[len_to_clear:]
+            if len_to_clear < 0:
+                self._start += max(len(self) + len_to_clear, 0)
+            else:
+                self._start += min(len_to_clear, len(self))
 
-            if not (self._message and len_to_clear > 0):
+            if not (len(self) and len_to_clear > 0):
                 self._is_not_empty = False
 
+            self._compact()
+
         else:
             self._is_not_empty = False
-            self._message = bytearray()
+            self._start = len(self._message)
+            self._compact()
 
     def get_all(self) -> bytes:
-        return bytes(self._message)
+        self._release_view()
+        return bytes(memoryview(self._message)[self._start:])
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        """
+        Find sub in unread data without copy
+        :return: int offset or -1
+        """
+        index = self._message.find(sub, self._start + start)
+        return index - self._start if index != -1 else -1
+
+    def startswith(self, prefix: bytes, start: int = 0) -> bool:
+        return self._message.startswith(prefix, self._start + start)
+
+    def view(self) -> memoryview:
+        """
+        Zero-copy view of unread data
+        View must be released (use with statement) before next buffer update
+        :return: memoryview
+        """
+        self._release_view()
+        return memoryview(self._message)[self._start:]
+
+    def read(self, start: int, end: int) -> bytes:
+        """
+        Copy of one packet from unread data
+        :return: bytes
+        """
+        self._release_view()
+        with memoryview(self._message) as message:
+            return bytes(message[self._start + start:self._start + end])
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """
+        Reserve space at the end of buffer for direct socket read
+        (asyncio.BufferedProtocol.get_buffer)
+        :param sizehint: int max count bytes for read
+        :return: memoryview writable view of reserved space
+        """
+        self._release_view()
+        if len(self) > self._max_buffer_size:
+            raise BufferOverflow
+
+        sizehint = min(sizehint, len(_ZEROS)) if sizehint > 0 else len(_ZEROS)
+
+        self._view_start = len(self._message)
+        self._message.extend(memoryview(_ZEROS)[:sizehint])
+        self._view = memoryview(self._message)[self._view_start:]
+        return self._view
+
+    def buffer_updated(self, nbytes: int):
+        """
+        Commit nbytes written in space from get_buffer
+        (asyncio.BufferedProtocol.buffer_updated)
+        :param nbytes: int
+        :return: None
+        """
+        self._release_view(nbytes)
+        if nbytes:
+            self._is_not_empty = True
+
+    def _release_view(self, nbytes: int = 0):
+        if self._view is None:
+            return
+
+        self._view.release()
+        self._view = None
+        del self._message[self._view_start + nbytes:]
+
+    def _compact(self):
+        if self._start == len(self._message):
+            size = self._start
+        elif (
+                self._start >= _COMPACT_SIZE
+                and
+                self._start * 2 >= len(self._message)
+        ):
+            size = self._start
+        else:
+            return
+
+        try:
+            del self._message[:size]
+        except BufferError:
+            # view of storage is still alive, leave old storage to its owner
+            self._message = self._message[size:]
+        self._start = 0
@@ -13,6 +13,8 @@ class ServerConfig:
             local_buffer_size: int = 1024 * 1024,
             timeout: int = 1200,
             queue_size: int = 10_000,
+            batch_size: int = 256,
+            publish_chunk_size: int = 64,
             **kwargs
     ):
         self.host = host                                # type: ignore
@@ -20,6 +22,10 @@ class ServerConfig:
         self.local_buffer_size = local_buffer_size
         self.timeout = timeout
         self.queue_size = queue_size
+        # max count of packets processed per one wakeup of client loop
+        self.batch_size = batch_size
+        # count of messages published at once from iterator of one packet
+        self.publish_chunk_size = publish_chunk_size
 
         self.__attrs = dict()
         for key, val in kwargs.items():
@@ -32,6 +38,8 @@ class ServerConfig:
             f"port={self.port},"
             f"local_buffer_size={self.local_buffer_size},"
             f"queue_size={self.queue_size},"
+            f"batch_size={self.batch_size},"
+            f"publish_chunk_size={self.publish_chunk_size},"
             f"kwargs={self.__attrs})"
         )
 
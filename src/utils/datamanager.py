@@ -79,6 +79,20 @@ class QueueIter(Generic[T], AsyncIterator):
         else:
             await self._queue.put(item)
 
+    async def put_batch(self, items: list[T]):
+        """
+        Put several items, wait only if queue is full
+        """
+        for item in items:
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                if self._clear_on_overflow:
+                    self._queue.get_nowait()
+                    self._queue.put_nowait(item)
+                else:
+                    await self._queue.put(item)
+
     async def get(self) -> T:
         return await self._queue.get()
 
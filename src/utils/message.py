@@ -147,7 +147,7 @@ class LBS:
         self._hdop: Optional[float]
         try:
             self._hdop = float(value)
-        except ValueError:
+        except (TypeError, ValueError):
             self._hdop = None
 
     @property
@@ -159,7 +159,7 @@ class LBS:
         self._pdop: Optional[float]
         try:
             self._pdop = float(value)
-        except ValueError:
+        except (TypeError, ValueError):
             self._pdop = None
 
     @property
@@ -212,7 +212,8 @@ class Parameters:
         return self._parameters
 
     def update(self, kwargs: dict[Any, Any]):
-        self._parameters.update(**kwargs)
+        # keys can be not str (io id of Teltonika)
+        self._parameters.update(kwargs)
 
 
 class Message:
@@ -227,7 +228,9 @@ class Message:
         self.time_ = time_
         self.navigation = navigation
         self.lbs = lbs
-        self.parameters = Parameters(**parameters if parameters else dict())
+        self.parameters = Parameters()
+        if parameters:
+            self.parameters.update(parameters)
         self.packet_type = packet_type
 
     def __repr__(self) -> str:
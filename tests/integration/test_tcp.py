@@ -2,8 +2,9 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock
 
+from src.protocol import WialonIPSv2
 from src.protocol.interface import MessageAnnotated
-from src.server.tcp import TCPServer
+from src.server.tcp import TCPServer, TCPBufferedServer
 from src.status import StatusAuth
 from src.utils.config import ServerConfig
 from src.protocol.abstract import AbstractProtocol
@@ -40,11 +41,15 @@ class Protocol(AbstractProtocol):
         return b"answer"
 
 
+SERVERS = [TCPServer, TCPBufferedServer]
+
+
 @pytest.mark.asyncio
-async def test_open_tcp_connection():
+@pytest.mark.parametrize('server_class', SERVERS)
+async def test_open_tcp_connection(server_class):
     config = ServerConfig(host="127.0.0.1", port=8888)
 
-    server = TCPServer(config, Protocol(), Mock(AbstractAuthorization))
+    server = server_class(config, Protocol(), Mock(AbstractAuthorization))
 
     # Start the server
     await server.run()
@@ -74,11 +79,12 @@ async def test_open_tcp_connection():
 
 
 @pytest.mark.asyncio
-async def test_tcp_sending_command():
+@pytest.mark.parametrize('server_class', SERVERS)
+async def test_tcp_sending_command(server_class):
     config = ServerConfig(host="127.0.0.1", port=8888)
     protocol = Mock(AbstractProtocol)
     authorization = Mock(AbstractAuthorization)
-    server = TCPServer(config, protocol, authorization)
+    server = server_class(config, protocol, authorization)
 
     # Start the server
     await server.run()
@@ -99,3 +105,104 @@ async def test_tcp_sending_command():
 
     await server.stop()
     await asyncio.sleep(0.1)
+
+
+LOGIN = b'#L#2.0;860000000000000;NA;46D4\r\n'
+DATA = (
+    b'#D#010125;112233;5128.199596;N;00000.122544;E;0;0;0;0;0;0;NA;;NA;'
+    b'example1:1:0,example2:2:0.12,example3:1:123;72D3\r\n'
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('server_class', SERVERS)
+async def test_tcp_burst_of_packets_in_one_write(server_class):
+    config = ServerConfig(host="127.0.0.1", port=8888)
+    authorization = Mock(AbstractAuthorization)
+    authorization.authorized_in_system = AsyncMock(return_value=1)
+    server = server_class(config, WialonIPSv2(), authorization)
+    await server.run()
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', 8888)
+    writer.write(LOGIN + DATA * 3)
+    await writer.drain()
+
+    answers = b'#AL#1\r\n' + b'#AD#1\r\n' * 3
+    assert await reader.readexactly(len(answers)) == answers
+
+    messages = [await server.messages.get() for _ in range(3)]
+    assert all(data.unit.id == 1 for data in messages)
+    assert [data.packet.packet for data in messages] == [DATA] * 3
+
+    writer.close()
+    await server.stop()
+    await asyncio.sleep(0.1)
+
+
+class StreamProtocol(Protocol):
+    """
+    Packet #<count>\r\n has count messages, #E\r\n fails after 3 messages
+    """
+    START_BIT_PACKET = b'#'
+    END_BIT_PACKET = b'\r\n'
+
+    def parsing_packet(self, bytes_: bytes, unit: Unit) -> MessageAnnotated:
+        if bytes_ == b'#E\r\n':
+            return self._broken()
+        return (mock_model for _ in range(int(bytes_[1:-2])))
+
+    @staticmethod
+    def _broken():
+        yield from (mock_model, mock_model, mock_model)
+        raise ValueError("broken record")
+
+    def answer_packet(self, status, unit: Unit) -> bytes:
+        return b"ok"
+
+    def answer_exception(self, status, unit: Unit) -> bytes:
+        return b"err"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('server_class', SERVERS)
+async def test_tcp_iterator_published_by_chunks(server_class):
+    config = ServerConfig(host="127.0.0.1", port=8888, publish_chunk_size=64)
+    server = server_class(config, StreamProtocol(), Mock(AbstractAuthorization))
+    await server.run()
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', 8888)
+    writer.write(b"start_test_end#1\r\n#130\r\n")
+    await writer.drain()
+
+    assert await reader.readexactly(10) == b"answerokok"
+    # answer is sent after all chunks of packet
+    chunks = [await server.messages.get() for _ in range(4)]
+    assert [len(data.messages) for data in chunks] == [1, 64, 64, 2]
+    assert {data.packet.packet for data in chunks[1:]} == {b"#130\r\n"}
+    assert server.messages._queue.empty()
+
+    writer.close()
+    await server.stop()
+    await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('server_class', SERVERS)
+async def test_tcp_iterator_exception(server_class):
+    config = ServerConfig(host="127.0.0.1", port=8888)
+    server = server_class(config, StreamProtocol(), Mock(AbstractAuthorization))
+    await server.run()
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', 8888)
+    writer.write(b"start_test_end#E\r\n")
+    await writer.drain()
+
+    assert await reader.readexactly(9) == b"answererr"
+    # messages decoded before exception are published
+    data = await server.messages.get()
+    assert len(data.messages) == 3
+    assert await reader.read(100) == b""
+
+    writer.close()
+    await server.stop()
+    await asyncio.sleep(0.1)
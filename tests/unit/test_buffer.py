@@ -41,7 +41,7 @@ def test_clear_removes_specified_length():
     buffer = Buffer(handler, config)
     buffer.update(b"data")
     buffer.clear(2)
-    assert buffer._message == b"ta"
+    assert buffer.get_all() == b"ta"
     assert buffer._is_not_empty
 
 
@@ -70,3 +70,86 @@ def test_is_not_empty_property_returns_correct_value():
     assert not buffer.is_not_empty
     buffer.update(b"data")
     assert buffer.is_not_empty
+
+
+def test_get_buffer_and_buffer_updated_commit_written_bytes():
+    handler = MockProtocol()
+    config = ServerConfig(host="127.0.0.1", port=1883, local_buffer_size=1024)
+    buffer = Buffer(handler, config)
+    buffer.update(b"da")
+
+    view = buffer.get_buffer(16)
+    assert len(view) == 16
+    view[:2] = b"ta"
+    buffer.buffer_updated(2)
+
+    assert buffer.get_all() == b"data"
+    assert buffer.is_not_empty
+
+
+def test_get_buffer_without_update_drops_reserved_space():
+    handler = MockProtocol()
+    config = ServerConfig(host="127.0.0.1", port=1883, local_buffer_size=1024)
+    buffer = Buffer(handler, config)
+    buffer.update(b"data")
+
+    buffer.get_buffer(16)
+    assert buffer.get_all() == b"data"
+
+
+def test_get_buffer_raises_buffer_overflow():
+    handler = MockProtocol()
+    config = ServerConfig(host="127.0.0.1", port=1883, local_buffer_size=1024)
+    buffer = Buffer(handler, config)
+    buffer._message = bytearray(b"a" * 1025)
+    with pytest.raises(BufferOverflow):
+        buffer.get_buffer(16)
+
+
+def test_clear_moves_offset_for_find_and_read():
+    handler = MockProtocol()
+    config = ServerConfig(host="127.0.0.1", port=1883, local_buffer_size=1024)
+    buffer = Buffer(handler, config)
+    buffer.update(b"#first#second")
+    buffer.clear(6)
+
+    assert len(buffer) == 7
+    assert buffer.startswith(b"#")
+    assert buffer.find(b"second") == 1
+    assert buffer.find(b"first") == -1
+    assert buffer.read(1, 7) == b"second"
+    with buffer.view() as view:
+        assert view == b"#second"
+
+
+def test_clear_negative_keeps_tail():
+    handler = MockProtocol()
+    config = ServerConfig(host="127.0.0.1", port=1883, local_buffer_size=1024)
+    buffer = Buffer(handler, config)
+    buffer.update(b"data")
+    buffer.clear(-1)
+    assert buffer.get_all() == b"a"
+    assert not buffer.is_not_empty
+
+
+def test_compaction_keeps_unread_data():
+    handler = MockProtocol()
+    config = ServerConfig(
+        host="127.0.0.1", port=1883, local_buffer_size=1024 * 1024
+    )
+    buffer = Buffer(handler, config)
+    buffer.update(b"a" * 100_000 + b"tail")
+    buffer.clear(100_000)
+
+    assert buffer._start == 0
+    assert buffer.get_all() == b"tail"
+
+
+def test_update_overflow_counts_only_unread_data():
+    handler = MockProtocol()
+    config = ServerConfig(host="127.0.0.1", port=1883, local_buffer_size=1024)
+    buffer = Buffer(handler, config)
+    buffer.update(b"a" * 1000)
+    buffer.clear(900)
+    buffer.update(b"a" * 1000)
+    assert len(buffer) == 1100
@@ -103,3 +103,29 @@ async def test_send_data_when_not_alive(connector_tcp):
     await asyncio.sleep(0)
     with pytest.raises(Exception, match="Connection was closed"):
         await connector_tcp.send(b'data')
+
+
+@pytest.mark.asyncio
+async def test_wait_new_data_wakes_on_data(connector_tcp):
+    waiter = asyncio.create_task(connector_tcp.wait_new_data())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    connector_tcp._reader_queue.put_nowait(b'data')
+    connector_tcp._new_data_event.set()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert connector_tcp.new_data is True
+
+
+@pytest.mark.asyncio
+async def test_wait_new_data_returns_when_task_done(connector_tcp):
+    connector_tcp._task_reader.cancel()
+    await asyncio.sleep(0)
+    await asyncio.wait_for(connector_tcp.wait_new_data(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wait_new_data_returns_on_timeout(connector_tcp):
+    connector_tcp._timeout_timestamp = time.time() + 0.05
+    await asyncio.wait_for(connector_tcp.wait_new_data(), timeout=1)
+    assert connector_tcp.new_data is False
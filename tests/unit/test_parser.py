@@ -0,0 +1,144 @@
+import struct
+
+from fastcrc import crc16
+
+from src.protocol import Teltonika, WialonIPSv2
+from src.protocol.parser import PacketParser
+from src.utils.buffer import Buffer
+from src.utils.config import ServerConfig
+from src.utils.unit import Unit
+
+
+class FramingTeltonika(Teltonika):
+    def parsing_packet(self, bytes_data, unit):
+        return None
+
+
+class FramingWialonIPSv2(WialonIPSv2):
+    def parsing_packet(self, bytes_, unit):
+        return None
+
+
+class CountingBuffer(Buffer):
+    """
+    Count bytes examined by find
+    """
+    __slots__ = ('examined',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.examined = 0
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        index = super().find(sub, start)
+        if index == -1:
+            self.examined += len(self) - start
+        else:
+            self.examined += index + len(sub) - start
+        return index
+
+
+def make_parser(protocol, authorized=True):
+    unit = Unit()
+    if authorized:
+        unit.id = 1
+    buffer = CountingBuffer(
+        handler=protocol,
+        config=ServerConfig(host="127.0.0.1", port=1883),
+    )
+    return PacketParser(protocol), buffer, unit
+
+
+def feed(parser, buffer, unit, data, chunk):
+    frames = list()
+    for offset in range(0, len(data), chunk):
+        buffer.update(data[offset:offset + chunk])
+        while buffer.is_not_empty:
+            result = parser.parsing(buffer=buffer, unit=unit)
+            if result:
+                frames.append(result[2])
+    return frames
+
+
+def teltonika_packet(body_records: bytes, count: int) -> bytes:
+    body = b'\x08' + bytes([count]) + body_records + bytes([count])
+    return (
+        b'\x00\x00\x00\x00'
+        + struct.pack('>L', len(body))
+        + body
+        + struct.pack('>L', crc16.arc(body))
+    )
+
+
+def wialon_packet(packet_type: bytes, body: bytes) -> bytes:
+    return b'#%b#%b%X\r\n' % (packet_type, body, crc16.arc(body))
+
+
+def test_teltonika_fragmented_packet_framed_once():
+    packet = teltonika_packet(b'\x01' * 3000, 1)
+    parser, buffer, unit = make_parser(FramingTeltonika())
+
+    frames = feed(parser, buffer, unit, packet * 2, chunk=7)
+
+    assert frames == [packet[4:], packet[4:]]
+    assert len(buffer) == 0
+
+
+def test_teltonika_login_fragmented():
+    parser, buffer, unit = make_parser(FramingTeltonika(), authorized=False)
+    buffer.update(b'\x00')
+    assert parser.parsing(buffer=buffer, unit=unit) is None
+
+    buffer.update(b'\x0f356307042441013')
+    status, _, packet = parser.parsing(buffer=buffer, unit=unit)
+    assert packet == b'356307042441013'
+    assert unit.imei == '356307042441013'
+
+
+def test_wialon_fragmented_packets():
+    packet = b'#D#1;2;3\r\n'
+    parser, buffer, unit = make_parser(FramingWialonIPSv2())
+
+    frames = feed(parser, buffer, unit, b'garbage' + packet * 3, chunk=3)
+
+    assert frames == [packet] * 3
+
+
+def test_wialon_byte_by_byte_examines_each_byte_once():
+    packet = wialon_packet(
+        b'B', b'|'.join([b'010125;112233;NA;NA;NA;NA;1;2;3;4'] * 500) + b';'
+    )
+    parser, buffer, unit = make_parser(FramingWialonIPSv2())
+
+    frames = feed(parser, buffer, unit, packet * 2, chunk=1)
+
+    assert frames == [packet] * 2
+    # every END search overlaps previous one by len(END) - 1 byte
+    assert buffer.examined <= len(b'\r\n') * len(packet * 2)
+
+
+def test_wialon_garbage_prefix_resync_is_linear():
+    garbage = bytes(range(256)).replace(b'#', b'') * 400
+    packet = b'#D#1;2;3\r\n'
+    parser, buffer, unit = make_parser(FramingWialonIPSv2())
+
+    frames = feed(parser, buffer, unit, garbage + packet, chunk=5)
+
+    assert frames == [packet]
+    assert buffer.examined <= len(garbage) + 2 * len(packet)
+
+
+def test_wialon_login_split_start_bits_byte_by_byte():
+    login = b'#L#2.0;860000000000000;NA;46D4\r\n'
+    parser, buffer, unit = make_parser(WialonIPSv2(), authorized=False)
+
+    results = list()
+    for byte in b'#L' + b'garbage#' + login:
+        buffer.update(bytes([byte]))
+        while buffer.is_not_empty:
+            if result := parser.parsing(buffer=buffer, unit=unit):
+                results.append(result)
+
+    assert [packet for _, _, packet in results] == [login]
+    assert unit.imei == '860000000000000'
+    assert buffer.examined <= 3 * (len(login) + 10)
@@ -0,0 +1,151 @@
+import struct
+from datetime import datetime, timezone
+
+import pytest
+from fastcrc import crc16
+
+from src.protocol import Teltonika
+from src.protocol.parser import PacketParser
+from src.utils.buffer import Buffer
+from src.utils.config import ServerConfig
+from src.utils.unit import Unit
+
+# examples from Teltonika data sending protocols documentation
+CODEC_8 = bytes.fromhex(
+    '000000000000003608010000016B40D8EA30010000000000000000000000000000000105'
+    '021503010101425E0F01F10000601A014E0000000000000000010000C7CF'
+)
+CODEC_8E = bytes.fromhex(
+    '000000000000004A8E010000016B412CEE00010000000000000000000000000000000001'
+    '0005000100010100010011001D00010010015E2C880002000B000000003544C87A000E00'
+    '0000001DD7E06A00000100002994'
+)
+
+
+def packet(codec: int, records: list[bytes]) -> bytes:
+    body = (
+        bytes([codec, len(records)]) + b''.join(records) + bytes([len(records)])
+    )
+    return (
+        b'\x00\x00\x00\x00'
+        + struct.pack('>L', len(body))
+        + body
+        + struct.pack('>L', crc16.arc(body))
+    )
+
+
+def record_8e(lon: int, lat: int, timestamp: int) -> bytes:
+    return (
+        struct.pack('>QBiiHHBH', timestamp, 0, lon, lat, 250, 359, 12, 95)
+        + struct.pack('>HH', 385, 3)
+        + struct.pack('>HHB', 1, 239, 1)
+        + struct.pack('>H', 0)
+        + struct.pack('>HHI', 1, 199, 123_456)
+        + struct.pack('>H', 0)
+        + struct.pack('>HHH', 1, 385, 4) + b'\xde\xad\xbe\xef'
+    )
+
+
+def parse(bytes_: bytes):
+    unit = Unit()
+    messages = list(Teltonika().parsing_packet(bytes_[4:], unit))
+    return messages, unit
+
+
+def test_codec_8_documentation_packet():
+    assert Teltonika().check_crc_data(CODEC_8[4:], Unit())
+    (message,), unit = parse(CODEC_8)
+
+    assert message.time_ == datetime(2019, 6, 10, 10, 4, 46, tzinfo=timezone.utc)
+    assert message.parameters.get() == {
+        'priority': 1, 21: 3, 1: 1, 66: 24079, 241: 24602, 78: 0
+    }
+    assert message.navigation.latitude == 0.0
+    assert message.navigation.longitude == 0.0
+    assert message.navigation.altitude == 0.0
+    assert unit.metadata.all_count_packet == b'\x01'
+
+
+def test_codec_8e_documentation_packet():
+    assert Teltonika().check_crc_data(CODEC_8E[4:], Unit())
+    (message,), unit = parse(CODEC_8E)
+
+    assert message.time_ == datetime(2019, 6, 10, 11, 36, 32, tzinfo=timezone.utc)
+    assert message.parameters.get() == {
+        'priority': 1,
+        1: 1,
+        17: 29,
+        16: 22949000,
+        11: 893700218,
+        14: 500686954,
+    }
+
+
+def test_codec_8e_negative_coordinates_and_variable_io():
+    records = [
+        record_8e(lon=-254_000_000, lat=-540_000_000, timestamp=1_700_000_000_000),
+        record_8e(lon=1_799_999_990, lat=899_999_990, timestamp=1_700_000_001_000),
+    ]
+    messages, unit = parse(packet(0x8e, records))
+
+    assert [m.navigation.longitude for m in messages] == [-25.4, 179.999999]
+    assert [m.navigation.latitude for m in messages] == [-54.0, 89.999999]
+    first = messages[0]
+    assert first.navigation.altitude == 250.0
+    assert first.navigation.course == 359
+    assert first.navigation.satellites == 12
+    assert first.navigation.speed == 95
+    assert first.parameters.get() == {
+        'priority': 0, 239: 1, 199: 123_456, 385: 'deadbeef'
+    }
+    assert unit.metadata.all_count_packet == b'\x02'
+
+
+def test_codec_8_many_records():
+    record = CODEC_8[10:-5]
+    messages, unit = parse(packet(0x08, [record] * 255))
+
+    assert len(messages) == 255
+    assert all(
+        m.parameters.get() == {
+            'priority': 1, 21: 3, 1: 1, 66: 24079, 241: 24602, 78: 0
+        }
+        for m in messages
+    )
+    assert unit.metadata.all_count_packet == b'\xff'
+
+
+@pytest.mark.parametrize('data', [CODEC_8, CODEC_8E])
+def test_packet_parser_frames_and_answers(data):
+    protocol = Teltonika()
+    unit = Unit()
+    unit.id = 1
+    buffer = Buffer(protocol, ServerConfig(host="127.0.0.1", port=1883))
+    buffer.update(data)
+
+    status, messages, frame = PacketParser(protocol).parsing(
+        buffer=buffer,
+        unit=unit,
+    )
+
+    assert status.correct
+    assert frame == data[4:]
+    assert len(list(messages)) == 1
+    assert status.make_answer(protocol, unit=unit) == b'\x00\x00\x00\x01'
+
+
+def test_io_plan_cache_reuses_layout():
+    protocol = Teltonika(io_plan_cache_size=2)
+    record = CODEC_8[10:-5]
+    list(protocol.parsing_packet(packet(0x08, [record] * 10)[4:], Unit()))
+
+    info = protocol.io_plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (9, 1, 1)
+
+    # two new layouts of codec 8E, cache is bounded by maxsize
+    list(protocol.parsing_packet(CODEC_8E[4:], Unit()))
+    list(protocol.parsing_packet(
+        packet(0x8e, [record_8e(0, 0, 1_700_000_000_000)])[4:], Unit()
+    ))
+    info = protocol.io_plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (9, 3, 2)
@@ -0,0 +1,78 @@
+import struct
+
+import pytest
+
+from src.protocol import Teltonika
+from src.utils.unit import Unit
+
+from .test_teltonika import CODEC_8, CODEC_8E, packet
+
+np = pytest.importorskip('numpy')
+
+
+def record_8(lon: int, lat: int, io_1: int, io_8: int) -> bytes:
+    return (
+        struct.pack('>QBiiHHBH', 1_700_000_000_000, 2, lon, lat, 7, 180, 5, 33)
+        + struct.pack('>BB', 0, io_1 + io_8)
+        + struct.pack('>B', io_1)
+        + b''.join(struct.pack('>BB', 10 + i, i) for i in range(io_1))
+        + struct.pack('>B', 0)
+        + struct.pack('>B', 0)
+        + struct.pack('>B', io_8)
+        + b''.join(struct.pack('>BQ', 100 + i, 2 ** 63 + i) for i in range(io_8))
+    )
+
+
+def dump(messages) -> list[tuple]:
+    return [
+        (
+            m.time_,
+            m.navigation.latitude,
+            m.navigation.longitude,
+            m.navigation.altitude,
+            m.navigation.course,
+            m.navigation.satellites,
+            m.navigation.speed,
+            m.parameters.get(),
+        )
+        for m in messages
+    ]
+
+
+MIXED = packet(0x08, [
+    CODEC_8[10:-5],
+    record_8(lon=-254_000_000, lat=-540_000_000, io_1=2, io_8=1),
+    record_8(lon=1, lat=-1, io_1=0, io_8=0),
+    CODEC_8[10:-5],
+    record_8(lon=-254_000_000, lat=540_000_000, io_1=2, io_8=1),
+])
+
+
+@pytest.mark.parametrize('data', [CODEC_8, MIXED])
+def test_vectorized_same_as_python(data):
+    python_unit, numpy_unit = Unit(), Unit()
+    expected = Teltonika().parsing_packet(data[4:], python_unit)
+    messages = Teltonika(vectorized=True).parsing_packet(data[4:], numpy_unit)
+
+    assert dump(messages) == dump(expected)
+    assert numpy_unit.metadata.all_count_packet == (
+        python_unit.metadata.all_count_packet
+    )
+
+
+def test_batch_columns():
+    batch = Teltonika().parsing_packet_batch(MIXED[4:], Unit())
+
+    assert len(batch) == 5
+    assert batch.longitude.tolist() == [0.0, -25.4, 1e-7, 0.0, -25.4]
+    assert batch.latitude.tolist() == [0.0, -54.0, -1e-7, 0.0, 54.0]
+    assert batch.time_[1] == 1_700_000_000_000
+    assert batch.parameters()[1] == {
+        'priority': 2, 10: 0, 11: 1, 100: 2 ** 63
+    }
+    assert batch.parameters()[2] == {'priority': 2}
+
+
+def test_batch_only_codec_8():
+    with pytest.raises(ValueError):
+        Teltonika().parsing_packet_batch(CODEC_8E[4:], Unit())
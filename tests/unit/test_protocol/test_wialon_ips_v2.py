@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastcrc import crc16
+
+from src.protocol import WialonIPSv2
+from src.utils.unit import Unit
+
+MESSAGE_SD = b'010125;112233;5128.199596;N;03708.122544;W;35;270;140;11'
+MESSAGE_D = (
+    MESSAGE_SD
+    + b';0.9;5;300;12.5,0.7;NA;'
+    + b'fuel:2:45.5,odometer:1:123456,driver:3:Ivan'
+)
+
+
+def wialon_packet(packet_type: bytes, body: bytes) -> bytes:
+    return b'#%b#%b%X\r\n' % (packet_type, body, crc16.arc(body))
+
+
+def parse(packet: bytes):
+    protocol, unit = WialonIPSv2(), Unit()
+    crc = protocol.check_crc_data(packet, unit)
+    return crc, list(protocol.parsing_packet(packet, unit)), unit
+
+
+def test_packet_d():
+    crc, (message,), unit = parse(wialon_packet(b'D', MESSAGE_D + b';'))
+
+    assert crc
+    assert unit.metadata.last_type_packet == b'D'
+    assert message.time_ == datetime(2025, 1, 1, 11, 22, 33, tzinfo=timezone.utc)
+    assert message.navigation.latitude == 51.469993
+    assert message.navigation.longitude == -37.135376
+    assert message.navigation.speed == 35
+    assert message.navigation.course == 270
+    assert message.navigation.altitude == 140.0
+    assert message.navigation.satellites == 11
+    assert message.lbs.hdop == 0.9
+
+    parameters = message.parameters.get()
+    assert parameters['ibutton'] is None
+    assert {k: v for k, v in parameters.items() if k.startswith('in_')} == {
+        'in_0': 1, 'in_1': 0, 'in_2': 1,
+    }
+    assert [parameters[f'out_{i}'] for i in range(9)] == [
+        0, 0, 1, 1, 0, 1, 0, 0, 1
+    ]
+    assert parameters['adc_0'] == 12.5
+    assert parameters['adc_1'] == 0.7
+    assert parameters['parameters'] == [
+        {'name': 'fuel', 'type': 2, 'value': 45.5},
+        {'name': 'odometer', 'type': 1, 'value': 123456},
+        {'name': 'driver', 'type': 3, 'value': 'Ivan'},
+    ]
+
+
+def test_packet_d_empty_fields():
+    body = b'NA;NA;NA;NA;NA;NA;NA;NA;NA;NA;NA;NA;NA;NA;NA;NA;'
+    crc, (message,), _ = parse(wialon_packet(b'D', body))
+
+    assert crc
+    assert message.navigation.latitude == 0.0
+    assert message.lbs is None
+    assert message.parameters.get() == {'ibutton': None}
+
+
+def test_packet_sd():
+    crc, (message,), unit = parse(wialon_packet(b'SD', MESSAGE_SD + b';'))
+
+    assert crc
+    assert unit.metadata.last_type_packet == b'SD'
+    assert message.navigation.longitude == -37.135376
+
+
+def test_packet_b_short_and_full_messages():
+    body = b'|'.join([MESSAGE_SD, MESSAGE_D, MESSAGE_SD]) + b';'
+    crc, messages, unit = parse(wialon_packet(b'B', body))
+
+    assert crc
+    assert unit.metadata.last_type_packet == b'B'
+    assert len(messages) == 3
+    assert messages[1].parameters.get()['adc_0'] == 12.5
+    assert messages[2].parameters.get() == {}
+
+
+@pytest.mark.parametrize('packet_type', [b'D', b'SD', b'B'])
+def test_wrong_crc(packet_type):
+    packet = wialon_packet(packet_type, MESSAGE_SD + b';')
+    packet = packet.replace(b'112233', b'112234')
+
+    crc, _, _ = parse(packet)
+    assert not crc
+
+
+def test_parsing_without_crc_check():
+    protocol, unit = WialonIPSv2(), Unit()
+    protocol.check_crc_data(wialon_packet(b'SD', MESSAGE_SD + b';'), unit)
+
+    # tokens of other packet are not reused
+    messages = protocol.parsing_packet(
+        wialon_packet(b'D', MESSAGE_D + b';'), unit
+    )
+    assert messages[0].parameters.get()['adc_1'] == 0.7
+    assert unit.metadata.last_type_packet == b'D'